@@ -35,6 +35,7 @@ class Settings(BaseSettings):
     postgres_database: str = Field(..., env="POSTGRES_DATABASE")
     postgres_user: str = Field(..., env="POSTGRES_USER")
     postgres_password: str = Field(..., env="POSTGRES_PASSWORD")
+    postgres_connect_timeout: int = Field(10, env="POSTGRES_CONNECT_TIMEOUT")  # seconds
     
     # Redis Configuration (for Celery)
     redis_url: str = Field("redis://localhost:6379/0", env="REDIS_URL")
@@ -61,6 +62,8 @@ class Settings(BaseSettings):
     obfuscate_names: bool = Field(True, env="OBFUSCATE_NAMES")
     obfuscation_salt: Optional[str] = Field(None, env="OBFUSCATION_SALT")
     state_dir: str = Field("state", env="STATE_DIR")
+    import_prefetch_chunks: int = Field(2, env="IMPORT_PREFETCH_CHUNKS")  # chunks decrypted ahead of the load
+    import_copy_connections: int = Field(4, env="IMPORT_COPY_CONNECTIONS")  # parallel COPYs for append loads
     
     # Compression Optimization
     sort_before_compress: bool = Field(True, env="SORT_BEFORE_COMPRESS")
@@ -118,7 +121,9 @@ def get_snowflake_connection_params() -> dict:
     # Add authentication-specific parameters
     if settings.snowflake_auth_method == "sso":
         params["authenticator"] = "externalbrowser"
-        # SSO will open a browser window for authentication
+        # SSO will open a browser window for authentication; caching the ID
+        # token lets later runs within its lifetime connect without the browser
+        params["client_store_temporary_credential"] = True
     elif settings.snowflake_auth_method == "password":
         if not settings.snowflake_password:
             raise ValueError("SNOWFLAKE_PASSWORD required when using password authentication")
@@ -137,8 +142,12 @@ def get_snowflake_connection_params() -> dict:
     # Add optional parameters for better connection management
     # These improve connection stability and session management
     params["client_session_keep_alive"] = True  # Keep session alive
-    params["login_timeout"] = 120  # 2 minutes for SSO login
+    # SSO needs time for the user to finish the browser login; non-interactive
+    # logins should fail fast when the account is unreachable (e.g. VPN down)
+    params["login_timeout"] = 120 if settings.snowflake_auth_method == "sso" else 30
     params["network_timeout"] = 30  # 30 seconds for network operations
+    # Sent with the login request, so tagging costs no extra round trip
+    params["session_parameters"] = {"QUERY_TAG": "ms_data_pipeline"}
     
     return params
 
@@ -158,5 +167,10 @@ def get_postgres_connection_params() -> dict:
         "port": settings.postgres_port,
         "database": settings.postgres_database,
         "user": settings.postgres_user,
-        "password": settings.postgres_password
+        "password": settings.postgres_password,
+        # Fail fast on an unreachable host instead of waiting out TCP retries,
+        # and keep long COPYs from being dropped by idle-connection timeouts
+        "connect_timeout": settings.postgres_connect_timeout,
+        "keepalives": 1,
+        "keepalives_idle": 30,
     }
\ No newline at end of file
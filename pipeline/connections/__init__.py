@@ -2,7 +2,7 @@
 Connection Management Module
 Provides centralized connection management for Snowflake and PostgreSQL
 """
-from pipeline.connections.snowflake_connection import SnowflakeConnectionManager
+from pipeline.connections.snowflake_connection import SnowflakeConnectionManager, quote_identifier
 from pipeline.connections.postgres_connection import PostgresConnectionManager
 
-__all__ = ['SnowflakeConnectionManager', 'PostgresConnectionManager']
+__all__ = ['SnowflakeConnectionManager', 'PostgresConnectionManager', 'quote_identifier']
@@ -2,15 +2,28 @@
 Snowflake Connection Manager
 Manages Snowflake database connections with SSO support
 """
-import snowflake.connector
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from pipeline.connections.base_connection import BaseConnectionManager
 from pipeline.config.settings import get_settings, get_snowflake_connection_params
 from pipeline.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import snowflake.connector
+
 logger = get_logger(__name__)
 
 
+def quote_identifier(*parts: str) -> str:
+    """
+    Quote a Snowflake identifier, joining qualified parts with dots
+    
+    e.g. ``quote_identifier("DB", "SCHEMA")`` -> ``"DB"."SCHEMA"``. Quoted
+    names are matched exactly as configured, like the string literals
+    compared against INFORMATION_SCHEMA.
+    """
+    return ".".join('"' + part.replace('"', '""') + '"' for part in parts)
+
+
 class SnowflakeConnectionManager(BaseConnectionManager):
     """
     Manages Snowflake database connections
@@ -40,13 +53,19 @@ class SnowflakeConnectionManager(BaseConnectionManager):
         self.settings = get_settings()
         self._connection_params = None
     
-    def connect(self) -> snowflake.connector.SnowflakeConnection:
+    def connect(self) -> "snowflake.connector.SnowflakeConnection":
         """
         Establish connection to Snowflake
         
+        snowflake.connector is imported here rather than at module level so
+        that importing pipeline.connections (e.g. for PostgreSQL only) does
+        not load the Snowflake client and its dependencies.
+        
         Returns:
             Snowflake connection object
         """
+        import snowflake.connector
+        
         try:
             if self._connection_params is None:
                 self._connection_params = get_snowflake_connection_params()
@@ -61,14 +80,11 @@ class SnowflakeConnectionManager(BaseConnectionManager):
             
             logger.info("Successfully connected to Snowflake")
             
-            # Log connection details
-            cursor = connection.cursor()
-            try:
-                cursor.execute("SELECT CURRENT_WAREHOUSE(), CURRENT_DATABASE(), CURRENT_SCHEMA()")
-                warehouse, database, schema = cursor.fetchone()
-                logger.info(f"Connected to: {warehouse}.{database}.{schema}")
-            finally:
-                cursor.close()
+            # Log connection details (the login response already carries the
+            # session's warehouse/database/schema, so no query is needed)
+            logger.info(
+                f"Connected to: {connection.warehouse}.{connection.database}.{connection.schema}"
+            )
             
             return connection
             
@@ -6,10 +6,9 @@ import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 from pathlib import Path
-from typing import Dict, Any, Generator, Optional, List
-import snowflake.connector
+from typing import Dict, Any, Generator, Optional, List, Tuple
 from pipeline.config.settings import get_settings
-from pipeline.connections import SnowflakeConnectionManager
+from pipeline.connections import SnowflakeConnectionManager, quote_identifier
 from pipeline.transformers.type_optimizer import optimize_dataframe
 from pipeline.utils.logger import get_logger
 
@@ -124,6 +123,39 @@ class SnowflakeDataExtractor:
         logger.warning(f"Invalid filter configuration type: {type(filter_config)}")
         return ""
     
+    @staticmethod
+    def _table_stats(cursor, database: str, schema: str, table: str) -> Optional[Tuple[Any, Any]]:
+        """
+        Look up a table's (row_count, bytes) from Snowflake metadata.
+        
+        Uses SHOW TABLES, which is answered by the cloud services layer
+        without compiling a query against INFORMATION_SCHEMA.TABLES. Views
+        aren't listed by SHOW TABLES, so a miss falls back to the
+        INFORMATION_SCHEMA lookup.
+        
+        Returns:
+            (row_count, bytes), or None if the table isn't found
+        """
+        # Escape LIKE wildcards, then the backslashes and quotes of the string
+        # literal; the exact name is still matched client-side below
+        pattern = table.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        literal = pattern.replace("\\", "\\\\").replace("'", "''")
+        cursor.execute(f"SHOW TABLES LIKE '{literal}' IN SCHEMA {quote_identifier(database, schema)}")
+        fields = {d[0].lower(): i for i, d in enumerate(cursor.description)}
+        for row in cursor:
+            if row[fields["name"]] == table:
+                return row[fields["rows"]], row[fields["bytes"]]
+        
+        cursor.execute(f"""
+        SELECT 
+            ROW_COUNT,
+            BYTES
+        FROM {quote_identifier(database)}.INFORMATION_SCHEMA.TABLES 
+        WHERE TABLE_SCHEMA = %s 
+        AND TABLE_NAME = %s
+        """, (schema, table))
+        return cursor.fetchone()
+    
     def estimate_table_size(
         self, 
         database: str, 
@@ -168,18 +200,11 @@ class SnowflakeDataExtractor:
                 
                 # Estimate size based on filtered row count
                 # Get average row size from table metadata
-                metadata_query = f"""
-                SELECT BYTES, ROW_COUNT
-                FROM {database}.INFORMATION_SCHEMA.TABLES 
-                WHERE TABLE_SCHEMA = '{schema}' 
-                AND TABLE_NAME = '{table}'
-                """
-                cursor.execute(metadata_query)
-                result = cursor.fetchone()
+                result = self._table_stats(cursor, database, schema, table)
                 
-                if result and result[1] and result[1] > 0:
-                    total_bytes = result[0] or 0
-                    total_rows = result[1]
+                if result and result[0] and result[0] > 0:
+                    total_rows = result[0]
+                    total_bytes = result[1] or 0
                     avg_row_size = total_bytes / total_rows
                     estimated_bytes = int(avg_row_size * row_count)
                 else:
@@ -199,17 +224,7 @@ class SnowflakeDataExtractor:
                 }
             else:
                 # No filter - use table metadata
-                query = f"""
-                SELECT 
-                    ROW_COUNT,
-                    BYTES
-                FROM {database}.INFORMATION_SCHEMA.TABLES 
-                WHERE TABLE_SCHEMA = '{schema}' 
-                AND TABLE_NAME = '{table}'
-                """
-                
-                cursor.execute(query)
-                result = cursor.fetchone()
+                result = self._table_stats(cursor, database, schema, table)
                 
                 if result:
                     row_count = result[0] or 0
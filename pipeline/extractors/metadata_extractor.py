@@ -3,15 +3,15 @@ Snowflake Metadata Extractor
 Extracts table schemas and metadata from Snowflake and saves to local repository
 """
 import json
-import yaml
-import tempfile
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-import snowflake.connector
+from concurrent.futures import ThreadPoolExecutor
 from pipeline.config.settings import get_settings, get_snowflake_connection_params
+from pipeline.connections import quote_identifier
 from pipeline.utils.logger import get_logger
+from pipeline.utils.config_loader import load_tables_config
 from pipeline.utils.metadata_comparator import MetadataComparator
 from pipeline.utils.change_logger import ChangeLogger
 from pipeline.utils.config_validator import validate_index_configuration, IndexValidationError
@@ -20,8 +20,10 @@ from pipeline.utils.ddl_generator import generate_ddl_with_indexes
 logger = get_logger(__name__)
 
 class SnowflakeMetadataExtractor:
-    def __init__(self, obfuscator=None):
+    def __init__(self, obfuscator=None, legacy_information_schema: bool = False):
         self.settings = get_settings()
+        # Read column/PK metadata from INFORMATION_SCHEMA instead of DESC TABLE
+        self.legacy_information_schema = legacy_information_schema
         encrypted_base = Path(self.settings.metadata_encrypted_dir)
         self.metadata_dir = encrypted_base / "schemas"
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
@@ -41,12 +43,33 @@ class SnowflakeMetadataExtractor:
             obfuscator=obfuscator,
         )
         self.obfuscator = obfuscator
+        self._conn = None
+        
+    def _get_connection(self):
+        """
+        Return this extractor's Snowflake connection, connecting on first use
+        
+        The session is reused for every table extracted through this
+        instance, so a run pays for one login (and one SSO prompt).
+        """
+        if self._conn is None or self._conn.is_closed():
+            self._conn = self.connect_to_snowflake()
+        return self._conn
+    
+    def close(self):
+        """Close the cached Snowflake connection, if one was opened"""
+        if self._conn is not None and not self._conn.is_closed():
+            logger.info("Closing Snowflake connection")
+            self._conn.close()
+        self._conn = None
         
     def connect_to_snowflake(self):
         """
         Establish connection to Snowflake (VPN side) with SSO support
         Uses connection parameters matching successful YAML practice
         """
+        import snowflake.connector
+        
         try:
             # Get connection parameters based on settings
             conn_params = get_snowflake_connection_params()
@@ -93,39 +116,46 @@ class SnowflakeMetadataExtractor:
         """
         Extract complete metadata for a specific table.
 
+        Columns and primary keys come from ``DESC TABLE``, which is answered
+        by Snowflake's cloud services layer without a warehouse query; with
+        ``legacy_information_schema`` they are read from INFORMATION_SCHEMA
+        instead.
+
         When ``source_query`` is provided, the column schema is taken from the
-        result of that query (via cursor.describe) rather than from
-        INFORMATION_SCHEMA.COLUMNS on the raw table. This is essential for
-        tables whose source_query rewrites the schema -- e.g. unpacking a
-        VARIANT/JSON column into many typed columns. Statistics and primary
+        result of that query (via cursor.describe) rather than from the raw
+        table. This is essential for tables whose source_query rewrites the
+        schema -- e.g. unpacking a VARIANT/JSON column into many typed columns. Statistics and primary
         keys still come from the raw table since that's where the data lives.
 
         Args:
             database: Snowflake database name
             schema: Snowflake schema name
             table: Snowflake table name
-            conn: Optional existing Snowflake connection (if None, creates new connection)
+            conn: Optional existing Snowflake connection (if None, uses the extractor's cached connection)
             source_query: Optional source query used to derive the actual output schema.
 
         Returns:
             Dictionary with table metadata
         """
-        # Use provided connection or create new one
-        should_close = False
+        # Use provided connection or the extractor's cached one
         if conn is None:
-            conn = self.connect_to_snowflake()
-            should_close = True
+            conn = self._get_connection()
         
         cursor = conn.cursor()
         
         try:
             logger.info(f"Extracting metadata for {database}.{schema}.{table}")
 
+            described_pks = None
             if source_query:
                 # Use the actual output schema produced by source_query.
                 column_dicts = self._extract_columns_from_source_query(
                     cursor, source_query, database, schema, table
                 )
+            elif not self.legacy_information_schema:
+                column_dicts, described_pks = self._describe_table_columns(
+                    cursor, database, schema, table
+                )
             else:
                 # Fall back to the raw table schema from INFORMATION_SCHEMA.
                 schema_query = f"""
@@ -138,13 +168,13 @@ class SnowflakeMetadataExtractor:
                     NUMERIC_PRECISION,
                     NUMERIC_SCALE,
                     ORDINAL_POSITION
-                FROM {database}.INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA = '{schema}'
-                AND TABLE_NAME = '{table}'
+                FROM {quote_identifier(database)}.INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = %s
+                AND TABLE_NAME = %s
                 ORDER BY ORDINAL_POSITION
                 """
 
-                cursor.execute(schema_query)
+                cursor.execute(schema_query, (schema, table))
                 rows = cursor.fetchall()
 
                 if not rows:
@@ -171,38 +201,43 @@ class SnowflakeMetadataExtractor:
                 ROW_COUNT,
                 BYTES,
                 LAST_ALTERED
-            FROM {database}.INFORMATION_SCHEMA.TABLES 
-            WHERE TABLE_SCHEMA = '{schema}' 
-            AND TABLE_NAME = '{table}'
+            FROM {quote_identifier(database)}.INFORMATION_SCHEMA.TABLES 
+            WHERE TABLE_SCHEMA = %s 
+            AND TABLE_NAME = %s
             """
             
-            cursor.execute(stats_query)
+            cursor.execute(stats_query, (schema, table))
             stats = cursor.fetchone()
             
             # Get primary key information from Snowflake
             primary_keys = []
-            try:
-                pk_query = f"""
-                SELECT kcu.COLUMN_NAME
-                FROM {database}.INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-                JOIN {database}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
-                  ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
-                  AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
-                  AND tc.TABLE_NAME = kcu.TABLE_NAME
-                WHERE tc.TABLE_SCHEMA = '{schema}'
-                  AND tc.TABLE_NAME = '{table}'
-                  AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
-                ORDER BY kcu.ORDINAL_POSITION
-                """
-                cursor.execute(pk_query)
-                pk_rows = cursor.fetchall()
-                primary_keys = [row[0] for row in pk_rows]
+            if described_pks is not None:
+                primary_keys = described_pks
                 if primary_keys:
                     logger.info(f"Found primary keys for {table}: {primary_keys}")
-                else:
-                    logger.debug(f"No primary key defined for {database}.{schema}.{table}")
-            except Exception as pk_err:
-                logger.debug(f"Could not query primary keys for {table}: {pk_err}")
+            else:
+                try:
+                    pk_query = f"""
+                    SELECT kcu.COLUMN_NAME
+                    FROM {quote_identifier(database)}.INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+                    JOIN {quote_identifier(database)}.INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+                      ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+                      AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
+                      AND tc.TABLE_NAME = kcu.TABLE_NAME
+                    WHERE tc.TABLE_SCHEMA = %s
+                      AND tc.TABLE_NAME = %s
+                      AND tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+                    ORDER BY kcu.ORDINAL_POSITION
+                    """
+                    cursor.execute(pk_query, (schema, table))
+                    pk_rows = cursor.fetchall()
+                    primary_keys = [row[0] for row in pk_rows]
+                    if primary_keys:
+                        logger.info(f"Found primary keys for {table}: {primary_keys}")
+                    else:
+                        logger.debug(f"No primary key defined for {database}.{schema}.{table}")
+                except Exception as pk_err:
+                    logger.debug(f"Could not query primary keys for {table}: {pk_err}")
             
             metadata = {
                 "table_info": {
@@ -210,7 +245,11 @@ class SnowflakeMetadataExtractor:
                     "schema": schema,
                     "table": table,
                     "full_name": f"{database}.{schema}.{table}",
-                    "schema_source": "source_query" if source_query else "information_schema",
+                    "schema_source": (
+                        "source_query" if source_query
+                        else "information_schema" if self.legacy_information_schema
+                        else "describe_table"
+                    ),
                 },
                 "columns": column_dicts,
                 "statistics": {
@@ -233,9 +272,6 @@ class SnowflakeMetadataExtractor:
             raise
         finally:
             cursor.close()
-            # Only close connection if we created it
-            if should_close:
-                conn.close()
     
     def _map_to_postgres_type(self, snowflake_type: str, max_length: int, precision: int, scale: int) -> str:
         """Map Snowflake data types to PostgreSQL equivalents"""
@@ -375,6 +411,74 @@ class SnowflakeMetadataExtractor:
         )
         return columns
 
+    def _describe_table_columns(
+        self,
+        cursor,
+        database: str,
+        schema: str,
+        table: str,
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Read column and primary-key metadata with ``DESC TABLE``.
+
+        DESC TABLE runs in Snowflake's cloud services layer, so unlike the
+        INFORMATION_SCHEMA views it doesn't resume or bill the warehouse.
+        Types are normalised to INFORMATION_SCHEMA.COLUMNS.DATA_TYPE names
+        (e.g. ``VARCHAR(16777216)`` -> ``TEXT``, ``NUMBER(38,0)`` -> ``NUMBER``
+        with precision 38 / scale 0) so change detection against metadata
+        saved by the legacy path doesn't report spurious type changes.
+
+        Returns:
+            (column dicts in the shape produced by extract_table_metadata,
+             primary key column names)
+        """
+        name = quote_identifier(database, schema, table)
+        cursor.execute(f"DESC TABLE {name}")
+        fields = {d[0].lower(): i for i, d in enumerate(cursor.description)}
+        rows = cursor.fetchall()
+
+        if not rows:
+            raise ValueError(f"Table {database}.{schema}.{table} not found or has no columns")
+
+        column_dicts: List[Dict[str, Any]] = []
+        primary_keys: List[str] = []
+        for row in rows:
+            if "kind" in fields and row[fields["kind"]] != "COLUMN":
+                continue
+
+            name = row[fields["name"]]
+            raw_type = row[fields["type"]]
+            base_type, _, args = raw_type.partition("(")
+            base_type = base_type.strip().upper()
+            args = [a.strip() for a in args.rstrip(")").split(",")] if args else []
+
+            max_length = precision = scale = None
+            if base_type == "VARCHAR":
+                base_type = "TEXT"
+                max_length = int(args[0]) if args else None
+            elif base_type == "BINARY":
+                max_length = int(args[0]) if args else None
+            elif base_type == "NUMBER" and args:
+                precision = int(args[0])
+                scale = int(args[1]) if len(args) > 1 else 0
+
+            column_dicts.append({
+                "name": name,
+                "data_type": base_type,
+                "is_nullable": row[fields["null?"]] == "Y",
+                "default_value": row[fields["default"]],
+                "max_length": max_length,
+                "precision": precision,
+                "scale": scale,
+                "position": len(column_dicts) + 1,
+                "postgres_type": self._map_to_postgres_type(base_type, max_length, precision, scale),
+            })
+
+            if "primary key" in fields and row[fields["primary key"]] == "Y":
+                primary_keys.append(name)
+
+        return column_dicts, primary_keys
+
     def _map_number_type(self, precision: int, scale: int) -> str:
         """Map Snowflake NUMBER type to appropriate PostgreSQL type"""
         if scale == 0:  # Integer
@@ -456,13 +560,9 @@ class SnowflakeMetadataExtractor:
             return None
         
         try:
-            with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
-                tmp_path = Path(tmp.name)
-            try:
-                self.obfuscator.encryptor.decrypt_file(encrypted_file, tmp_path, password)
-                old_metadata = json.loads(tmp_path.read_text(encoding="utf-8"))
-            finally:
-                tmp_path.unlink(missing_ok=True)
+            old_metadata = json.loads(
+                self.obfuscator.encryptor.decrypt_to_bytes(encrypted_file, password)
+            )
             
             # Compare metadata (all in memory)
             comparison = self.comparator.compare_metadata(old_metadata, new_metadata)
@@ -580,10 +680,21 @@ class SnowflakeMetadataExtractor:
         """
         comparison = None
         archived_files = None
+        fingerprint = self.comparator.schema_fingerprint(metadata)
         
         if check_changes:
-            # Check for changes (obfuscated or non-obfuscated)
-            if self.obfuscator and password:
+            # Check for changes (obfuscated or non-obfuscated). A matching
+            # fingerprint for the current metadata file means nothing the
+            # comparator looks at has changed, so skip loading/decrypting it.
+            if self._read_fingerprint(table_name) == fingerprint:
+                logger.info(f"No metadata changes detected for {table_name} (fingerprint match)")
+                comparison = {
+                    "has_changes": False,
+                    "changed": False,
+                    "changes": [],
+                    "summary": "No changes detected",
+                }
+            elif self.obfuscator and password:
                 comparison = self.check_metadata_changed_obfuscated(table_name, metadata, password)
             else:
                 comparison = self.check_metadata_changed(table_name, metadata)
@@ -662,8 +773,78 @@ class SnowflakeMetadataExtractor:
             json.dump(metadata, f, indent=2, default=str)
         logger.info(f"Saved raw metadata to {raw_file}")
         
+        self._write_fingerprint(table_name, metadata_file, fingerprint)
+        
         return metadata_file, comparison
     
+    def _current_metadata_file(self, table_name: str) -> Path:
+        """Path of the saved (encrypted or plain) metadata file for a table"""
+        if self.obfuscator:
+            file_id = self.obfuscator.generate_metadata_file_id(table_name, "metadata")
+            return self.metadata_dir / f"{file_id}.enc"
+        return self.metadata_dir / f"{table_name}_metadata.json"
+    
+    def _fingerprint_path(self, table_name: str) -> Path:
+        # Kept with the raw copies: the fingerprint is derived from plaintext
+        # metadata and must not travel with the encrypted deliverables.
+        return self.raw_metadata_dir / f"{table_name}_metadata.hash"
+    
+    def _read_fingerprint(self, table_name: str) -> Optional[str]:
+        """
+        Return the stored schema fingerprint, or None if it is missing or
+        no longer describes the current metadata file (mtime/size differ)
+        """
+        metadata_file = self._current_metadata_file(table_name)
+        try:
+            with open(self._fingerprint_path(table_name), 'r') as f:
+                sidecar = json.load(f)
+            st = metadata_file.stat()
+        except (OSError, ValueError):
+            return None
+        
+        if sidecar.get("source") != [metadata_file.name, st.st_mtime_ns, st.st_size]:
+            return None
+        return sidecar.get("fingerprint")
+    
+    def _write_fingerprint(self, table_name: str, metadata_file: Path, fingerprint: str):
+        """Record the schema fingerprint of the metadata file just written"""
+        try:
+            st = metadata_file.stat()
+            with open(self._fingerprint_path(table_name), 'w') as f:
+                json.dump({
+                    "fingerprint": fingerprint,
+                    "source": [metadata_file.name, st.st_mtime_ns, st.st_size],
+                }, f)
+        except OSError as e:
+            logger.debug(f"Could not write metadata fingerprint for {table_name}: {e}")
+    
+    @staticmethod
+    def extraction_result(
+        metadata: Dict[str, Any],
+        metadata_file: Path,
+        ddl_file: Path,
+        index_columns: Optional[List[str]],
+        comparison: Optional[Dict[str, Any]],
+        check_changes: bool,
+    ) -> Dict[str, Any]:
+        """
+        Build the per-table success record reported by the extract script.
+        
+        Shared by the single-table and batch paths so both emit the same
+        shape. has_changes/is_new are None when change checking didn't run.
+        """
+        return {
+            "status": "success",
+            "metadata_file": str(metadata_file),
+            "ddl_file": str(ddl_file),
+            "columns": len(metadata["columns"]),
+            "row_count": metadata["statistics"]["row_count"],
+            "indexes": len(index_columns) if index_columns else 0,
+            "has_changes": comparison["has_changes"] if comparison else None,
+            "is_new": (comparison is None) if check_changes else None,
+            "comparison": comparison,
+        }
+    
     def generate_postgres_ddl(
         self, 
         metadata: Dict[str, Any], 
@@ -737,21 +918,24 @@ class SnowflakeMetadataExtractor:
         
         return ddl_file
     
-    def extract_all_configured_tables(self, check_changes: bool = False, password: Optional[str] = None, conn=None, table_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    def extract_all_configured_tables(self, check_changes: bool = False, password: Optional[str] = None, conn=None, table_names: Optional[List[str]] = None, max_workers: int = 8, force: bool = False) -> Dict[str, Any]:
         """
         Extract metadata for all tables in config/tables.yaml
         
         Args:
             check_changes: Whether to check for metadata changes
             password: Encryption password (required if obfuscation enabled)
-            conn: Optional external Snowflake connection to reuse
+            conn: Optional external Snowflake connection to reuse (defaults to
+                the extractor's cached connection; call close() when done)
             table_names: Optional list of table names to filter to (None = all)
+            max_workers: Tables whose Snowflake metadata is fetched concurrently
+            force: With check_changes, re-extract tables even when Snowflake's
+                LAST_ALTERED shows they haven't changed since the last run
             
         Returns:
             Dictionary with extraction results for each table
         """
-        with open("config/tables.yaml", 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_tables_config()
         
         table_configs = config["tables"]
         if table_names:
@@ -760,12 +944,35 @@ class SnowflakeMetadataExtractor:
         
         results = {}
         
-        owns_connection = conn is None
-        if owns_connection:
-            logger.info("Establishing Snowflake connection for all tables...")
-            conn = self.connect_to_snowflake()
+        if conn is None:
+            logger.info("Using one Snowflake connection for all tables...")
+            conn = self._get_connection()
+        
+        # Tables Snowflake reports as unaltered since the last extraction reuse
+        # their stored metadata instead of being described again
+        unaltered = {}
+        if check_changes and not force:
+            unaltered = self._find_unaltered_tables(conn, table_configs)
+        
+        # Snowflake metadata calls are network-bound: run them concurrently,
+        # each on its own cursor of the shared connection, while the results
+        # are validated and saved one table at a time in config order.
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(table_configs))))
         
         try:
+            pending = {
+                table_config["name"]: executor.submit(
+                    self.extract_table_metadata,
+                    table_config["snowflake"]["database"],
+                    table_config["snowflake"]["schema"],
+                    table_config["snowflake"]["table"],
+                    conn=conn,
+                    source_query=table_config["snowflake"].get("source_query"),
+                )
+                for table_config in table_configs
+                if table_config["name"] not in unaltered
+            }
+            
             for table_config in table_configs:
                 table_name = table_config["name"]
                 sf_config = table_config["snowflake"]
@@ -776,13 +983,14 @@ class SnowflakeMetadataExtractor:
                 try:
                     logger.info(f"Processing table: {table_name}")
                     
-                    metadata = self.extract_table_metadata(
-                        sf_config["database"],
-                        sf_config["schema"],
-                        sf_config["table"],
-                        conn=conn,
-                        source_query=sf_config.get("source_query"),
-                    )
+                    if table_name in unaltered:
+                        metadata = unaltered[table_name]
+                        logger.info(
+                            f"{table_name} unaltered since last extraction "
+                            f"(LAST_ALTERED {metadata['statistics']['last_altered']}) - reusing stored metadata"
+                        )
+                    else:
+                        metadata = pending[table_name].result()
 
                     if sf_config.get("source_query"):
                         # Safety net: if a merge_key still isn't in the metadata
@@ -824,13 +1032,24 @@ class SnowflakeMetadataExtractor:
                             }
                             continue
                     
-                    metadata_file, comparison = self.save_metadata_to_file(
-                        metadata, 
-                        table_name, 
-                        check_changes=check_changes,
-                        password=password
-                    )
+                    if table_name in unaltered:
+                        metadata_file = self._current_metadata_file(table_name)
+                        comparison = {
+                            "has_changes": False,
+                            "changed": False,
+                            "changes": [],
+                            "summary": "No changes detected",
+                        }
+                    else:
+                        metadata_file, comparison = self.save_metadata_to_file(
+                            metadata, 
+                            table_name, 
+                            check_changes=check_changes,
+                            password=password
+                        )
                     
+                    # DDL is always regenerated so index/merge-key edits in
+                    # tables.yaml apply even when the schema is unchanged
                     merge_keys = table_config.get("merge_keys", [])
                     ddl = self.generate_postgres_ddl(
                         metadata,
@@ -842,17 +1061,10 @@ class SnowflakeMetadataExtractor:
                     
                     ddl_file = self.save_postgres_ddl(ddl, table_name, password=password)
                     
-                    results[table_name] = {
-                        "status": "success",
-                        "metadata_file": str(metadata_file),
-                        "ddl_file": str(ddl_file),
-                        "columns": len(metadata["columns"]),
-                        "row_count": metadata["statistics"]["row_count"],
-                        "indexes": len(index_columns) if index_columns else 0,
-                        "has_changes": comparison["has_changes"] if comparison else None,
-                        "is_new": comparison is None,
-                        "comparison": comparison
-                    }
+                    results[table_name] = self.extraction_result(
+                        metadata, metadata_file, ddl_file, index_columns,
+                        comparison, check_changes,
+                    )
                     
                 except Exception as e:
                     logger.error(f"Failed to process table {table_name}: {e}")
@@ -861,16 +1073,89 @@ class SnowflakeMetadataExtractor:
                         "error": str(e)
                     }
         finally:
-            if owns_connection:
-                logger.info("Closing Snowflake connection")
-                conn.close()
+            executor.shutdown(wait=True, cancel_futures=True)
         
         return results
+    
+    def _find_unaltered_tables(self, conn, table_configs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Find tables whose Snowflake LAST_ALTERED equals the value recorded at
+        their last extraction
+        
+        LAST_ALTERED moves on any DDL or DML, so an unchanged value means both
+        the schema and the statistics in the stored metadata are still
+        current. Stored metadata is read from the plain raw copy, so nothing
+        is decrypted. LAST_ALTERED is fetched with one INFORMATION_SCHEMA.TABLES
+        query per database rather than per table.
+        
+        Tables with a source_query are never skipped: the query text (or the
+        other tables it reads) can change without touching the base table.
+        
+        Returns:
+            {table_name: stored metadata} for tables that can be skipped
+        """
+        stored = {}
+        for table_config in table_configs:
+            table_name = table_config["name"]
+            if table_config["snowflake"].get("source_query"):
+                continue
+            raw_file = self.raw_metadata_dir / f"{table_name}_metadata.json"
+            if not raw_file.exists() or not self._current_metadata_file(table_name).exists():
+                continue
+            try:
+                with open(raw_file, 'r') as f:
+                    metadata = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if metadata.get("statistics", {}).get("last_altered"):
+                stored[table_name] = metadata
+        
+        if not stored:
+            return {}
+        
+        configs_by_database: Dict[str, List[Dict[str, Any]]] = {}
+        for table_config in table_configs:
+            if table_config["name"] in stored:
+                configs_by_database.setdefault(table_config["snowflake"]["database"], []).append(table_config)
+        
+        unaltered = {}
+        cursor = conn.cursor()
+        try:
+            for database, configs in configs_by_database.items():
+                schemas = sorted({c["snowflake"]["schema"] for c in configs})
+                placeholders = ", ".join(["%s"] * len(schemas))
+                try:
+                    cursor.execute(
+                        f"SELECT TABLE_SCHEMA, TABLE_NAME, LAST_ALTERED "
+                        f"FROM {quote_identifier(database)}.INFORMATION_SCHEMA.TABLES "
+                        f"WHERE TABLE_SCHEMA IN ({placeholders})",
+                        schemas,
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not read LAST_ALTERED for {database}, extracting all its tables: {e}")
+                    continue
+                
+                last_altered = {(row[0], row[1]): str(row[2]) for row in cursor}
+                for table_config in configs:
+                    sf_config = table_config["snowflake"]
+                    current = last_altered.get((sf_config["schema"], sf_config["table"]))
+                    metadata = stored[table_config["name"]]
+                    if current is not None and current == metadata["statistics"]["last_altered"]:
+                        unaltered[table_config["name"]] = metadata
+        finally:
+            cursor.close()
+        
+        if unaltered:
+            logger.info(f"{len(unaltered)} table(s) unaltered since last extraction: {', '.join(unaltered)}")
+        return unaltered
 
 if __name__ == "__main__":
     import pandas as pd
     extractor = SnowflakeMetadataExtractor()
-    results = extractor.extract_all_configured_tables()
+    try:
+        results = extractor.extract_all_configured_tables()
+    finally:
+        extractor.close()
     print("Metadata extraction results:")
     for table, result in results.items():
         print(f"  {table}: {result['status']}")
\ No newline at end of file
@@ -8,15 +8,14 @@ Supports three sync modes:
   - upsert:      Load into staging table then INSERT ... ON CONFLICT DO UPDATE
 """
 import io
-import csv
 import json
-import math
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Union, BinaryIO
 
 import numpy as np
 import pandas as pd
 import psycopg2
+import pyarrow.parquet as pq
 
 from pipeline.config.settings import get_settings, get_postgres_connection_params
 from pipeline.utils.logger import get_logger
@@ -29,6 +28,7 @@ class PostgreSQLDataLoader:
 
     def __init__(self):
         self.settings = get_settings()
+        self._conn = None
 
     def connect_to_postgres(self):
         try:
@@ -40,6 +40,40 @@ class PostgreSQLDataLoader:
             logger.error(f"Failed to connect to PostgreSQL: {e}")
             raise
 
+    def _connection(self):
+        """Return the loader's shared connection, opening it on first use.
+
+        One session is kept for the loader's lifetime so a multi-table
+        import pays for a single PostgreSQL login. Call close() when done.
+        """
+        if self._conn is None or self._conn.closed:
+            self._conn = self.connect_to_postgres()
+        return self._conn
+
+    def _release(self, conn):
+        """Leave the shared connection idle after an operation.
+
+        Ends any transaction a read-only query left open; writers have
+        already committed or rolled back. A broken connection is dropped
+        so the next operation reconnects.
+        """
+        if conn.closed:
+            self._conn = None
+            return
+        try:
+            if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+        except psycopg2.Error:
+            conn.close()
+            self._conn = None
+
+    def close(self):
+        """Close the shared PostgreSQL connection, if open."""
+        if self._conn is not None and not self._conn.closed:
+            self._conn.close()
+            logger.info("Closed PostgreSQL connection")
+        self._conn = None
+
     # ------------------------------------------------------------------
     # Public entry point
     # ------------------------------------------------------------------
@@ -76,9 +110,11 @@ class PostgreSQLDataLoader:
             return "TIMESTAMPTZ" if "tz" in dtype_str.lower() else "TIMESTAMP"
         return "TEXT"
 
-    def _get_table_columns(self, schema: str, table: str) -> List[str]:
+    def _get_table_columns(self, schema: str, table: str, conn=None) -> List[str]:
         """Return lowercase column names for a PostgreSQL table."""
-        conn = self.connect_to_postgres()
+        own_conn = conn is None
+        if own_conn:
+            conn = self._connection()
         cursor = conn.cursor()
         try:
             cursor.execute(
@@ -87,23 +123,29 @@ class PostgreSQLDataLoader:
                 "ORDER BY ordinal_position",
                 (schema.lower(), table.lower()),
             )
-            return [row[0].lower() for row in cursor.fetchall()]
+            return [row[0].lower() for row in cursor]
         finally:
             cursor.close()
-            conn.close()
+            if own_conn:
+                self._release(conn)
 
     def _add_missing_columns(
-        self, schema: str, table: str, df: pd.DataFrame, target_cols: set
+        self, schema: str, table: str, df: pd.DataFrame, target_cols: set, conn=None
     ) -> List[str]:
         """ALTER TABLE to add columns present in *df* but missing from the target.
 
+        When *conn* is given the ALTERs join its open transaction and are
+        neither committed nor rolled back here.
+
         Returns the list of column names that were added.
         """
         new_cols = [c for c in df.columns if c not in target_cols]
         if not new_cols:
             return []
 
-        conn = self.connect_to_postgres()
+        own_conn = conn is None
+        if own_conn:
+            conn = self._connection()
         cursor = conn.cursor()
         try:
             for col in new_cols:
@@ -112,46 +154,47 @@ class PostgreSQLDataLoader:
                     f'ALTER TABLE {schema}.{table} ADD COLUMN IF NOT EXISTS "{col}" {pg_type}'
                 )
                 logger.info(f"Added column \"{col}\" ({pg_type}) to {schema}.{table}")
-            conn.commit()
+            if own_conn:
+                conn.commit()
         except Exception as e:
-            conn.rollback()
+            if own_conn:
+                conn.rollback()
             logger.error(f"Failed to add columns: {e}")
             raise
         finally:
             cursor.close()
-            conn.close()
+            if own_conn:
+                self._release(conn)
 
         return new_cols
 
     def load_parquet_to_table(
         self,
-        parquet_path: Path,
+        parquet_path: Union[Path, BinaryIO],
         schema: str,
         table: str,
         sync_mode: str = "full",
         merge_keys: Optional[List[str]] = None,
-        batch_size: int = 10000,
+        batch_size: int = 100_000,
     ) -> Dict[str, Any]:
         """Load a single Parquet chunk into a PostgreSQL table.
 
         Args:
-            parquet_path: Path to the Parquet file.
+            parquet_path: Path to the Parquet file, or a seekable file-like
+                object over its bytes (e.g. a chunk decrypted in memory).
             schema: PostgreSQL schema name.
             table: PostgreSQL table name.
             sync_mode: One of "full", "incremental", or "upsert".
             merge_keys: Column names used as conflict keys for upsert mode.
-            batch_size: Rows per COPY batch (only affects memory, not SQL).
+            batch_size: Rows per record batch read from the Parquet file and
+                serialized into the COPY stream (only affects memory, not SQL).
         """
-        logger.info(f"Reading {parquet_path.name}")
-        df = pd.read_parquet(parquet_path, engine="pyarrow")
-        total_rows = len(df)
-        logger.info(f"  Rows: {total_rows:,}")
-
-        df.columns = [col.lower() for col in df.columns]
-        df = df.where(pd.notnull(df), None)
+        parquet_file = self._open_parquet(parquet_path)
 
         target_cols = set(self._get_table_columns(schema, table))
-        added = self._add_missing_columns(schema, table, df, target_cols)
+        added = self._add_missing_columns(
+            schema, table, self._empty_frame(parquet_file), target_cols
+        )
         if added:
             logger.info(
                 f"Schema evolution: added {len(added)} column(s) to {schema}.{table}: "
@@ -159,38 +202,120 @@ class PostgreSQLDataLoader:
             )
 
         if sync_mode == "upsert" and merge_keys:
+            df = self._to_frame(parquet_file.read())
             return self._upsert_via_staging(df, schema, table, merge_keys)
         else:
-            return self._copy_load(df, schema, table)
+            return self._copy_load(
+                self._iter_parquet_frames(parquet_file, batch_size),
+                self._parquet_columns(parquet_file),
+                schema,
+                table,
+            )
+
+    @staticmethod
+    def _open_parquet(parquet_path: Union[Path, BinaryIO]) -> pq.ParquetFile:
+        """Open a Parquet chunk for batched reading."""
+        logger.info(f"Reading {getattr(parquet_path, 'name', 'in-memory Parquet')}")
+        if isinstance(parquet_path, Path):
+            parquet_path = str(parquet_path)
+        parquet_file = pq.ParquetFile(parquet_path)
+        logger.info(f"  Rows: {parquet_file.metadata.num_rows:,}")
+        return parquet_file
+
+    @staticmethod
+    def _parquet_columns(parquet_file: pq.ParquetFile) -> List[str]:
+        """Lowercased column names of a Parquet chunk, in file order."""
+        return [name.lower() for name in parquet_file.schema_arrow.names]
+
+    @staticmethod
+    def _to_frame(data) -> pd.DataFrame:
+        """Convert an Arrow table or record batch to a frame with lowercased
+        columns and NaN mapped to None."""
+        df = data.to_pandas()
+        df.columns = [col.lower() for col in df.columns]
+        return df.where(pd.notnull(df), None)
+
+    @staticmethod
+    def _empty_frame(parquet_file: pq.ParquetFile) -> pd.DataFrame:
+        """Zero-row frame carrying the chunk's lowercased columns and dtypes."""
+        df = parquet_file.schema_arrow.empty_table().to_pandas()
+        df.columns = [col.lower() for col in df.columns]
+        return df
+
+    @classmethod
+    def _iter_parquet_frames(
+        cls, parquet_file: pq.ParquetFile, batch_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """Yield the chunk as frames of at most *batch_size* rows."""
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            yield cls._to_frame(batch)
+
+    def begin_bulk_load(self, schema: str, table: str, truncate: bool = True) -> "BulkLoad":
+        """Open a single-transaction bulk load of many chunks into one table.
+
+        Usage::
+
+            with loader.begin_bulk_load(schema, table) as bulk:
+                for chunk in chunks:
+                    bulk.load_parquet(chunk)
+
+        With *truncate* the table is emptied inside the same transaction, which
+        lets every chunk be written with COPY ... FREEZE. The load commits once
+        when the block exits; any exception rolls everything back, including
+        the TRUNCATE.
+        """
+        return BulkLoad(self, schema, table, truncate=truncate)
 
     # ------------------------------------------------------------------
     # COPY-based fast insert (replaces iterrows + execute_batch)
     # ------------------------------------------------------------------
 
-    def _copy_load(self, df: pd.DataFrame, schema: str, table: str) -> Dict[str, Any]:
-        """Bulk load via COPY FROM STDIN — typically 10-50x faster than INSERT."""
-        conn = self.connect_to_postgres()
+    def _copy_load(
+        self,
+        frames: Iterable[pd.DataFrame],
+        columns: List[str],
+        schema: str,
+        table: str,
+        conn=None,
+        freeze: bool = False,
+    ) -> Dict[str, Any]:
+        """Bulk load via COPY FROM STDIN — typically 10-50x faster than INSERT.
+
+        All *frames* are streamed through one COPY statement, serialized a
+        batch at a time as the server reads.
+
+        When *conn* is given the COPY joins its open transaction and is
+        neither committed nor rolled back here. *freeze* is only valid when
+        the table was created or truncated in that same transaction.
+        """
+        own_conn = conn is None
+        if own_conn:
+            conn = self._connection()
         cursor = conn.cursor()
 
         try:
-            columns = df.columns.tolist()
             cols_str = ", ".join(f'"{c}"' for c in columns)
-            copy_sql = f'COPY {schema}.{table} ({cols_str}) FROM STDIN WITH (FORMAT CSV, NULL \'\\N\')'
+            options = "FORMAT CSV, NULL '\\N', FREEZE" if freeze else "FORMAT CSV, NULL '\\N'"
+            copy_sql = f'COPY {schema}.{table} ({cols_str}) FROM STDIN WITH ({options})'
 
-            buf = self._dataframe_to_csv_buffer(df)
-            cursor.copy_expert(copy_sql, buf)
-            conn.commit()
+            stream = _CsvStream(frames)
+            cursor.copy_expert(copy_sql, stream, size=_CsvStream.READ_SIZE)
+            if own_conn:
+                conn.commit()
 
-            logger.info(f"COPY loaded {len(df):,} rows to {schema}.{table}")
-            return {"rows_loaded": len(df), "table": f"{schema}.{table}", "status": "success", "method": "copy"}
+            method = "copy_freeze" if freeze else "copy"
+            logger.info(f"COPY loaded {stream.rows:,} rows to {schema}.{table}")
+            return {"rows_loaded": stream.rows, "table": f"{schema}.{table}", "status": "success", "method": method}
 
         except Exception as e:
-            conn.rollback()
+            if own_conn:
+                conn.rollback()
             logger.error(f"COPY load failed: {e}")
             raise
         finally:
             cursor.close()
-            conn.close()
+            if own_conn:
+                self._release(conn)
 
     # ------------------------------------------------------------------
     # Upsert via staging table
@@ -212,7 +337,7 @@ class PostgreSQLDataLoader:
         keys_set = set(keys_lower)
         desired_name = f"uq_{table.lower()}_{'_'.join(keys_lower)}"
 
-        conn = self.connect_to_postgres()
+        conn = self._connection()
         cursor = conn.cursor()
         try:
             cursor.execute(
@@ -281,7 +406,7 @@ class PostgreSQLDataLoader:
             raise
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
 
     def _upsert_via_staging(
         self,
@@ -303,7 +428,7 @@ class PostgreSQLDataLoader:
                 f"({', '.join(merge_keys_lower)})"
             )
 
-        conn = self.connect_to_postgres()
+        conn = self._connection()
         cursor = conn.cursor()
         staging_table = f"_staging_{table}"
 
@@ -363,7 +488,7 @@ class PostgreSQLDataLoader:
             raise
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
 
     # ------------------------------------------------------------------
     # Helpers
@@ -371,21 +496,14 @@ class PostgreSQLDataLoader:
 
     @staticmethod
     def _dataframe_to_csv_buffer(df: pd.DataFrame) -> io.StringIO:
-        """Serialize a DataFrame to an in-memory CSV buffer suitable for COPY."""
+        """Serialize a DataFrame to an in-memory CSV buffer suitable for COPY.
+
+        Uses pandas' vectorised writer rather than iterating rows; nulls
+        (None, NaN, NaT, pd.NA) are written as ``\\N`` to match the COPY
+        ``NULL`` option.
+        """
         buf = io.StringIO()
-        writer = csv.writer(buf, quoting=csv.QUOTE_MINIMAL)
-        for _, row in df.iterrows():
-            cleaned = []
-            for val in row:
-                if val is None:
-                    cleaned.append("\\N")
-                elif isinstance(val, float) and math.isnan(val):
-                    cleaned.append("\\N")
-                elif pd.isna(val):
-                    cleaned.append("\\N")
-                else:
-                    cleaned.append(str(val))
-            writer.writerow(cleaned)
+        df.to_csv(buf, index=False, header=False, na_rep="\\N")
         buf.seek(0)
         return buf
 
@@ -394,7 +512,7 @@ class PostgreSQLDataLoader:
     # ------------------------------------------------------------------
 
     def verify_row_count(self, schema: str, table: str, expected_count: int) -> bool:
-        conn = self.connect_to_postgres()
+        conn = self._connection()
         cursor = conn.cursor()
 
         try:
@@ -410,10 +528,10 @@ class PostgreSQLDataLoader:
             return matches
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
 
     def truncate_table(self, schema: str, table: str):
-        conn = self.connect_to_postgres()
+        conn = self._connection()
         cursor = conn.cursor()
 
         try:
@@ -426,26 +544,131 @@ class PostgreSQLDataLoader:
             raise
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
 
     def get_table_info(self, schema: str, table: str) -> Dict[str, Any]:
-        conn = self.connect_to_postgres()
+        conn = self._connection()
         cursor = conn.cursor()
 
         try:
-            cursor.execute(f"SELECT COUNT(*) FROM {schema}.{table}")
-            row_count = cursor.fetchone()[0]
-
             cursor.execute(
-                f"SELECT pg_size_pretty(pg_total_relation_size('{schema}.{table}'))"
+                f"SELECT (SELECT COUNT(*) FROM {schema}.{table}), "
+                f"pg_size_pretty(pg_total_relation_size('{schema}.{table}'))"
             )
-            table_size = cursor.fetchone()[0]
+            row_count, table_size = cursor.fetchone()
 
             logger.info(f"Table {schema}.{table}: {row_count:,} rows, {table_size}")
             return {"row_count": row_count, "table_size": table_size}
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
+
+
+# ---------------------------------------------------------------------------
+# Streaming COPY source
+# ---------------------------------------------------------------------------
+
+class _CsvStream:
+    """Read-only file-like object that renders DataFrames as COPY CSV on demand.
+
+    copy_expert pulls data with read(size) until it gets an empty string, so
+    only the batch currently being sent is held as CSV text.
+    """
+
+    READ_SIZE = 1 << 16
+
+    def __init__(self, frames: Iterable[pd.DataFrame]):
+        self._frames = iter(frames)
+        self._text = ""
+        self._pos = 0
+        self.rows = 0
+
+    def read(self, size: int = -1) -> str:
+        while self._pos >= len(self._text):
+            df = next(self._frames, None)
+            if df is None:
+                return ""
+            self.rows += len(df)
+            self._text = PostgreSQLDataLoader._dataframe_to_csv_buffer(df).getvalue()
+            self._pos = 0
+
+        end = len(self._text) if size is None or size < 0 else self._pos + size
+        data = self._text[self._pos:end]
+        self._pos += len(data)
+        return data
+
+
+# ---------------------------------------------------------------------------
+# Single-transaction bulk load
+# ---------------------------------------------------------------------------
+
+class BulkLoad:
+    """Context manager returned by PostgreSQLDataLoader.begin_bulk_load()."""
+
+    def __init__(self, loader: PostgreSQLDataLoader, schema: str, table: str, truncate: bool = True):
+        self.loader = loader
+        self.schema = schema
+        self.table = table
+        self.truncate = truncate
+        self.conn = None
+        self._target_cols: set = set()
+
+    def __enter__(self) -> "BulkLoad":
+        self.conn = self.loader._connection()
+        try:
+            if self.truncate:
+                with self.conn.cursor() as cursor:
+                    cursor.execute(f"TRUNCATE TABLE {self.schema}.{self.table}")
+                logger.info(f"Truncated {self.schema}.{self.table} (bulk load transaction)")
+            self._target_cols = set(
+                self.loader._get_table_columns(self.schema, self.table, conn=self.conn)
+            )
+        except Exception:
+            self.conn.rollback()
+            self.loader._release(self.conn)
+            raise
+        return self
+
+    def load_parquet(
+        self, parquet_path: Union[Path, BinaryIO], batch_size: int = 100_000
+    ) -> Dict[str, Any]:
+        """COPY one Parquet chunk into the table within the open transaction."""
+        parquet_file = self.loader._open_parquet(parquet_path)
+
+        added = self.loader._add_missing_columns(
+            self.schema,
+            self.table,
+            self.loader._empty_frame(parquet_file),
+            self._target_cols,
+            conn=self.conn,
+        )
+        if added:
+            self._target_cols.update(added)
+            logger.info(
+                f"Schema evolution: added {len(added)} column(s) to {self.schema}.{self.table}: "
+                f"{', '.join(added)}"
+            )
+
+        return self.loader._copy_load(
+            self.loader._iter_parquet_frames(parquet_file, batch_size),
+            self.loader._parquet_columns(parquet_file),
+            self.schema,
+            self.table,
+            conn=self.conn,
+            freeze=self.truncate,
+        )
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.conn.commit()
+                logger.info(f"Committed bulk load into {self.schema}.{self.table}")
+            else:
+                self.conn.rollback()
+                logger.error(f"Bulk load into {self.schema}.{self.table} rolled back")
+        finally:
+            self.loader._release(self.conn)
+        return False
 
 
 # ---------------------------------------------------------------------------
@@ -480,6 +703,4 @@ class ChunkCheckpoint:
             json.dump({"table_name": table_name, "loaded_chunks": sorted(loaded)}, f)
 
     def clear(self, table_name: str):
-        path = self._path(table_name)
-        if path.exists():
-            path.unlink()
+        self._path(table_name).unlink(missing_ok=True)
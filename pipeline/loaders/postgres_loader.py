@@ -5,13 +5,13 @@ schema evolution via ALTER TABLE and a migration tracking table.
 """
 import json
 import re
-import yaml
 import psycopg2
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from pipeline.config.settings import get_settings, get_postgres_connection_params
 from pipeline.utils.logger import get_logger
+from pipeline.utils.config_loader import load_tables_config
 from pipeline.utils.ddl_generator import classify_schema_changes, generate_alter_statements
 
 logger = get_logger(__name__)
@@ -263,8 +263,7 @@ class PostgreSQLLoader:
     # ------------------------------------------------------------------
 
     def create_all_configured_tables(self, drop_if_exists: bool = False) -> Dict[str, Any]:
-        with open("config/tables.yaml", "r") as f:
-            config = yaml.safe_load(f)
+        config = load_tables_config()
 
         results: Dict[str, Any] = {}
         for table_config in config["tables"]:
@@ -3,6 +3,7 @@ File Encryptor/Decryptor
 Provides secure AES-256-GCM encryption with password-based key derivation
 """
 import os
+import mmap
 import hashlib
 import base64
 from pathlib import Path
@@ -112,21 +113,7 @@ class FileEncryptor:
             Dictionary with decryption metadata (checksum)
         """
         try:
-            # Read encrypted file
-            with open(input_path, 'rb') as f:
-                # Read salt (16 bytes)
-                salt = f.read(16)
-                # Read nonce (12 bytes)
-                nonce = f.read(12)
-                # Read ciphertext (rest of file)
-                ciphertext = f.read()
-            
-            # Derive key from password
-            key = self.derive_key(password, salt)
-            
-            # Decrypt using AES-GCM
-            aesgcm = AESGCM(key)
-            plaintext = aesgcm.decrypt(nonce, ciphertext, None)
+            plaintext = self._decrypt(input_path, password)
             
             # Calculate checksum of decrypted file
             checksum = hashlib.sha256(plaintext).hexdigest()
@@ -136,7 +123,6 @@ class FileEncryptor:
                 f.write(plaintext)
             
             logger.info(f"Decrypted {input_path.name} -> {output_path.name}")
-            logger.debug(f"  Encrypted size: {len(salt) + len(nonce) + len(ciphertext):,} bytes")
             logger.debug(f"  Decrypted size: {len(plaintext):,} bytes")
             
             return {
@@ -150,32 +136,48 @@ class FileEncryptor:
                 logger.error("Decryption failed - wrong password or corrupted file")
             raise
     
-    def verify_checksum(self, file_path: Path, expected_checksum: str) -> bool:
+    def decrypt_to_bytes(self, input_path: Path, password: str) -> bytes:
         """
-        Verify file checksum
+        Decrypt a file into memory without writing the plaintext to disk
         
         Args:
-            file_path: Path to file
-            expected_checksum: Expected SHA-256 checksum
+            input_path: Path to encrypted file
+            password: Decryption password
             
         Returns:
-            True if checksum matches
+            Decrypted file contents
         """
         try:
-            with open(file_path, 'rb') as f:
-                actual_checksum = hashlib.sha256(f.read()).hexdigest()
-            
-            matches = actual_checksum == expected_checksum
-            
-            if matches:
-                logger.info(f"Checksum verified for {file_path.name}")
-            else:
-                logger.error(f"Checksum mismatch for {file_path.name}")
-                logger.error(f"  Expected: {expected_checksum}")
-                logger.error(f"  Actual: {actual_checksum}")
-            
-            return matches
-            
+            plaintext = self._decrypt(input_path, password)
+            logger.info(f"Decrypted {input_path.name} in memory ({len(plaintext):,} bytes)")
+            return plaintext
         except Exception as e:
-            logger.error(f"Failed to verify checksum for {file_path}: {e}")
-            return False
+            logger.error(f"Failed to decrypt {input_path}: {e}")
+            if "authentication" in str(e).lower():
+                logger.error("Decryption failed - wrong password or corrupted file")
+            raise
+    
+    def _decrypt(self, input_path: Path, password: str) -> bytes:
+        """
+        Decrypt salt + nonce + ciphertext from input_path and return the plaintext
+        
+        The file is memory-mapped and the ciphertext handed to AES-GCM as a
+        memoryview, so it is never copied into a Python bytes object; peak
+        memory is the plaintext plus page cache rather than twice the chunk.
+        """
+        with open(input_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= 28:
+                # Too short to hold salt + nonce + tag (and empty files can't
+                # be mapped); let AES-GCM reject it as usual
+                salt, nonce, ciphertext = f.read(16), f.read(12), f.read()
+                return AESGCM(self.derive_key(password, salt)).decrypt(nonce, ciphertext, None)
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as mv:
+                # Salt (16 bytes) + nonce (12 bytes) + ciphertext (rest of file)
+                salt = bytes(mv[:16])
+                nonce = bytes(mv[16:28])
+                
+                # Decrypt using AES-GCM
+                aesgcm = AESGCM(self.derive_key(password, salt))
+                with mv[28:] as ciphertext:
+                    return aesgcm.decrypt(nonce, ciphertext, None)
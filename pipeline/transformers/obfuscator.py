@@ -200,8 +200,7 @@ class DataObfuscator:
                 logger.info("Encrypting master index...")
                 encryption_info = self.encryptor.encrypt_file(temp_json, output_path, password)
             finally:
-                if temp_json.exists():
-                    temp_json.unlink()
+                temp_json.unlink(missing_ok=True)
             
             logger.info(f"Master index created and encrypted: {output_path}")
             logger.info(f"  Size: {encryption_info['encrypted_size'] / 1024:.2f} KB")
@@ -235,16 +234,7 @@ class DataObfuscator:
         try:
             logger.info(f"Decrypting master index: {index_path}")
             
-            fd, tmp_path_str = tempfile.mkstemp(suffix=".json", dir=str(index_path.parent))
-            temp_json = Path(tmp_path_str)
-            os.close(fd)
-            try:
-                self.encryptor.decrypt_file(index_path, temp_json, password)
-                with open(temp_json, "r") as f:
-                    master_index = json.load(f)
-            finally:
-                if temp_json.exists():
-                    temp_json.unlink()
+            master_index = json.loads(self.encryptor.decrypt_to_bytes(index_path, password))
             
             logger.info(f"Master index decrypted successfully")
             logger.info(f"  Version: {master_index.get('version')}")
@@ -367,8 +357,7 @@ class MetadataObfuscator(DataObfuscator):
                 logger.info("Encrypting metadata master index...")
                 encryption_info = self.encryptor.encrypt_file(temp_json, output_path, password)
             finally:
-                if temp_json.exists():
-                    temp_json.unlink()
+                temp_json.unlink(missing_ok=True)
             
             logger.info(f"Metadata master index created and encrypted: {output_path}")
             logger.info(f"  Size: {encryption_info['encrypted_size'] / 1024:.2f} KB")
@@ -27,30 +27,42 @@ class DataTypeOptimizer:
         """
         Optimize DataFrame data types
         
+        The input frame is not modified; unchanged columns are shared with
+        the returned frame rather than copied.
+        
         Args:
             df: Input DataFrame
         
         Returns:
             Tuple of (optimized DataFrame, optimization stats)
         """
-        original_size = df.memory_usage(deep=True).sum()
+        # Only object/category data needs the slow per-value deep scan; object
+        # columns the loop leaves alone are not measured twice
+        index_size = df.index.memory_usage()
+        original_col_sizes = {col: self._column_size(df[col]) for col in df.columns}
+        original_size = index_size + sum(original_col_sizes.values())
         optimizations = {
             'int_downcast': 0,
             'float_downcast': 0,
             'categorical_conversion': 0,
             'columns_optimized': []
         }
+        # Converted columns are collected here and the frame is rebuilt once
+        # at the end, instead of reassigning df[col] column by column
+        converted: Dict[Any, pd.Series] = {}
         
         for col in df.columns:
-            col_type = df[col].dtype
+            series = df[col]
+            col_type = series.dtype
             original_col_type = str(col_type)
             
             try:
                 # Downcast integers
                 if col_type in ['int64', 'int32', 'int16']:
-                    df[col] = pd.to_numeric(df[col], downcast='integer')
-                    new_type = str(df[col].dtype)
+                    downcast = pd.to_numeric(series, downcast='integer')
+                    new_type = str(downcast.dtype)
                     if new_type != original_col_type:
+                        converted[col] = downcast
                         optimizations['int_downcast'] += 1
                         optimizations['columns_optimized'].append({
                             'column': col,
@@ -62,9 +74,9 @@ class DataTypeOptimizer:
                 # Downcast floats (only if aggressive mode)
                 elif col_type == 'float64' and self.aggressive:
                     # Check if conversion to float32 is safe
-                    max_val = df[col].abs().max()
+                    max_val = series.abs().max()
                     if pd.notna(max_val) and max_val < 3.4e38:  # float32 max
-                        df[col] = df[col].astype('float32')
+                        converted[col] = series.astype('float32')
                         optimizations['float_downcast'] += 1
                         optimizations['columns_optimized'].append({
                             'column': col,
@@ -75,14 +87,16 @@ class DataTypeOptimizer:
                 
                 # Convert low-cardinality strings to categorical
                 elif col_type == 'object':
-                    num_unique = df[col].nunique()
-                    num_total = len(df[col])
+                    num_unique = series.nunique()
+                    num_total = len(series)
                     
                     if num_total > 0:
                         unique_ratio = num_unique / num_total
                         
                         if unique_ratio < self.categorical_threshold:
-                            df[col] = df[col].astype('category')
+                            converted[col] = pd.Series(
+                                pd.Categorical(series), index=series.index, name=col
+                            )
                             optimizations['categorical_conversion'] += 1
                             optimizations['columns_optimized'].append({
                                 'column': col,
@@ -96,7 +110,17 @@ class DataTypeOptimizer:
                 logger.warning(f"Failed to optimize column {col}: {e}")
                 continue
         
-        optimized_size = df.memory_usage(deep=True).sum()
+        if converted:
+            df = pd.DataFrame(
+                {col: converted.get(col, df[col]) for col in df.columns},
+                index=df.index,
+                copy=False,
+            )
+        
+        optimized_size = index_size + sum(
+            self._column_size(df[col]) if col in converted else size
+            for col, size in original_col_sizes.items()
+        )
         reduction_bytes = original_size - optimized_size
         reduction_pct = (reduction_bytes / original_size * 100) if original_size > 0 else 0
         
@@ -116,6 +140,12 @@ class DataTypeOptimizer:
         
         return df, optimizations
 
+    @staticmethod
+    def _column_size(series: pd.Series) -> int:
+        """Bytes used by a column, matching memory_usage(deep=True)"""
+        # Object, string and categorical dtypes all report kind "O"
+        return int(series.memory_usage(index=False, deep=series.dtype.kind in "OSU"))
+
 
 def optimize_dataframe(
     df: pd.DataFrame, 
@@ -4,8 +4,9 @@ Logs metadata changes to console and persistent log files
 Versioned files are kept in metadata/encrypted/schemas and metadata/encrypted/ddl folders
 """
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 from pipeline.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -378,6 +379,45 @@ class ChangeLogger:
         Returns:
             List of log entries (most recent first)
         """
+        entries = self.iter_change_history(table_name, password=password)
+        return list(islice(entries, limit if limit and limit > 0 else None))
+    
+    def iter_change_history(
+        self,
+        table_name: str,
+        password: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Yield change log entries for a table, most recent first
+        
+        Entries are split off the end of the log one at a time, so a caller
+        that stops early (e.g. --limit) never splits or strips the older
+        part of the log.
+        
+        Args:
+            table_name: Name of the table
+            password: Decryption password (required if obfuscation enabled)
+            
+        Yields:
+            Log entries (most recent first)
+        """
+        content = self._read_change_log(table_name, password)
+        if not content:
+            return
+        
+        separator = "=" * 80
+        end = len(content)
+        while end > 0:
+            start = content.rfind(separator, 0, end)
+            entry = content[start + len(separator) if start >= 0 else 0:end].strip()
+            if entry:
+                yield entry
+            if start < 0:
+                break
+            end = start
+    
+    def _read_change_log(self, table_name: str, password: Optional[str] = None) -> Optional[str]:
+        """Return the full text of a table's change log, or None if unavailable"""
         if self.obfuscator and password:
             # Encrypted mode: use deterministic file ID
             file_id = self.obfuscator.generate_metadata_file_id(table_name, "changes")
@@ -385,51 +425,29 @@ class ChangeLogger:
             
             if not log_file.exists():
                 logger.info(f"No change log found for {table_name}")
-                return []
+                return None
             
             try:
-                # Decrypt to temporary file
-                temp_log = self.log_dir / f"{file_id}_temp.log"
-                self.obfuscator.encryptor.decrypt_file(log_file, temp_log, password)
-                
-                # Read content
-                with open(temp_log, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Remove temporary file
-                temp_log.unlink()
-                
+                # Decrypt in memory; normalise newlines as text-mode reads do
+                content = self.obfuscator.encryptor.decrypt_to_bytes(log_file, password)
+                return content.decode('utf-8').replace('\r\n', '\n')
             except Exception as e:
                 logger.error(f"Failed to read encrypted change log for {table_name}: {e}")
-                return []
-        else:
-            # Non-encrypted mode: use table name
-            log_file = self.log_dir / f"{table_name}_changes.log"
-            
-            if not log_file.exists():
-                logger.info(f"No change log found for {table_name}")
-                return []
-            
-            try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except Exception as e:
-                logger.error(f"Failed to read change log for {table_name}: {e}")
-                return []
-        
-        # Split by separator
-        entries = content.split("=" * 80)
-        # Remove empty entries
-        entries = [e.strip() for e in entries if e.strip()]
+                return None
         
-        # Reverse to get most recent first
-        entries.reverse()
+        # Non-encrypted mode: use table name
+        log_file = self.log_dir / f"{table_name}_changes.log"
         
-        # Apply limit if specified
-        if limit and limit > 0:
-            entries = entries[:limit]
+        if not log_file.exists():
+            logger.info(f"No change log found for {table_name}")
+            return None
         
-        return entries
+        try:
+            with open(log_file, 'r', encoding='utf-8') as f:
+                return f.read()
+        except Exception as e:
+            logger.error(f"Failed to read change log for {table_name}: {e}")
+            return None
     
     def get_changes_by_date_range(
         self,
@@ -0,0 +1,87 @@
+"""
+Config Loader
+Loads YAML configuration files, preferring PyYAML's libyaml-backed C loader,
+with an mtime-keyed JSON cache for config/tables.yaml
+"""
+import os
+import json
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Union
+
+import yaml
+
+from pipeline.utils.logger import get_logger
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+logger = get_logger(__name__)
+
+
+def load_yaml(path: Union[str, Path]) -> Any:
+    """
+    Parse a YAML file with the safe loader.
+
+    Uses ``CSafeLoader`` when PyYAML was built against libyaml and falls
+    back to the pure-Python ``SafeLoader`` otherwise. Both accept the same
+    documents as ``yaml.safe_load``.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed document
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def load_tables_config(path: Union[str, Path] = "config/tables.yaml") -> Dict[str, Any]:
+    """
+    Load the table configuration, reusing a parsed JSON cache when fresh.
+
+    The cache lives next to the source (``tables.yaml.cache.json``) and is
+    keyed by the source file's mtime and size, so any edit to the YAML
+    invalidates it. Documents that don't survive a JSON round trip
+    unchanged (e.g. YAML dates or non-string keys) are never cached.
+
+    Args:
+        path: Path to tables.yaml
+
+    Returns:
+        Parsed configuration dictionary
+    """
+    path = Path(path)
+    st = path.stat()
+    key = [st.st_mtime_ns, st.st_size]
+    cache_path = path.with_name(path.name + ".cache.json")
+
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+        if cached.get("_key") == key:
+            return cached["data"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    config = load_yaml(path)
+
+    try:
+        encoded = json.dumps({"_key": key, "data": config})
+        if json.loads(encoded)["data"] != config:
+            return config
+        fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=str(path.parent))
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(encoded)
+            os.replace(tmp_name, cache_path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+
+    return config
@@ -2,14 +2,112 @@
 Content Hash Comparator
 Provides content-based change detection for export files using SHA-256 hashing
 """
+import os
+import hmac
+import json
+import mmap
+import base64
 import hashlib
+import tempfile
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from pipeline.transformers.encryptor import FileEncryptor
 from pipeline.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Files at or above this size are hashed through a memory map
+MMAP_THRESHOLD = 1 << 20
+
+
+class _HashCache:
+    """
+    Content hashes of encrypted files, keyed by path and invalidated by
+    the file's size, mtime and inode.
+    
+    Stored as JSON in the state directory. The file also records a check
+    value derived from the encryption password (PBKDF2 with a random salt
+    stored alongside it, same cost as decrypting), so entries written under
+    one password are never trusted under another and a password rotation
+    still re-encrypts every file.
+    """
+    
+    def __init__(self, path: Path, derive_key: Callable[[str, bytes], bytes]):
+        self.path = path
+        self._derive_key = derive_key
+        self._entries: Optional[Dict[str, List]] = None
+        self._password: Optional[str] = None
+        self._check_salt: Optional[bytes] = None
+        self._password_check: Optional[str] = None
+        self._dirty = False
+    
+    @staticmethod
+    def _stat_key(file_path: Path) -> List[int]:
+        st = file_path.stat()
+        return [st.st_size, st.st_mtime_ns, st.st_ino]
+    
+    def _check(self, password: str, salt: bytes) -> str:
+        return hashlib.sha256(self._derive_key(password, salt)).hexdigest()
+    
+    def _load(self, password: str) -> Dict[str, List]:
+        if self._entries is not None and self._password == password:
+            return self._entries
+        entries: Dict[str, List] = {}
+        salt = None
+        check = None
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            salt = base64.b64decode(data["check_salt"])
+            check = self._check(password, salt)
+            if hmac.compare_digest(data.get("password_check", ""), check):
+                entries = data.get("entries", {})
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+        if not salt:
+            # Missing, legacy or unreadable cache file: start a new one
+            salt = os.urandom(16)
+            check = self._check(password, salt)
+        self._entries = entries
+        self._password = password
+        self._check_salt = salt
+        self._password_check = check
+        return entries
+    
+    def get(self, file_path: Path, password: str) -> Optional[str]:
+        entry = self._load(password).get(str(file_path.resolve()))
+        if entry and entry[:3] == self._stat_key(file_path):
+            return entry[3]
+        return None
+    
+    def put(self, file_path: Path, password: str, digest: str):
+        entries = self._load(password)
+        entries[str(file_path.resolve())] = self._stat_key(file_path) + [digest]
+        self._dirty = True
+    
+    def save(self):
+        if self._entries is None:
+            return
+        # Forget chunk files that have since been deleted or replaced
+        live = {path: entry for path, entry in self._entries.items() if os.path.exists(path)}
+        if len(live) != len(self._entries):
+            self._entries = live
+            self._dirty = True
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=str(self.path.parent))
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"check_salt": base64.b64encode(self._check_salt).decode("ascii"),
+                           "password_check": self._password_check,
+                           "entries": self._entries}, f)
+            os.replace(tmp_name, self.path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._dirty = False
+
 
 class ContentHashComparator:
     """
@@ -19,21 +117,49 @@ class ContentHashComparator:
     content hashes of new data with existing encrypted files.
     """
     
-    def __init__(self, encryptor: FileEncryptor):
+    def __init__(self, encryptor: FileEncryptor, cache_dir: Optional[str] = None):
         """
         Initialize with an encryptor for decrypting existing files.
         
         Args:
             encryptor: FileEncryptor instance for decryption operations
+            cache_dir: Directory for the persistent hash cache
+                       (content_hash_cache.json); no cache when None
         """
         self.encryptor = encryptor
         self.logger = logger
+        self._cache = (
+            _HashCache(Path(cache_dir) / "content_hash_cache.json", encryptor.derive_key)
+            if cache_dir else None
+        )
+    
+    def remember_hash(self, encrypted_file: Path, content_hash: str, password: str):
+        """
+        Record the content hash of an encrypted file that was just written,
+        so the next run can skip decrypting it. No-op without a cache.
+        """
+        if self._cache is None:
+            return
+        try:
+            self._cache.put(encrypted_file, password, content_hash)
+        except OSError as e:
+            self.logger.debug(f"Could not cache hash for {encrypted_file.name}: {e}")
+    
+    def save_cache(self):
+        """Persist the hash cache, if one is configured and has changed."""
+        if self._cache is None:
+            return
+        try:
+            self._cache.save()
+        except OSError as e:
+            self.logger.warning(f"Failed to save hash cache {self._cache.path}: {e}")
     
     def compute_file_hash(self, file_path: Path) -> str:
         """
         Compute SHA-256 hash of a file's contents.
         
-        Reads the file in chunks to handle large files efficiently.
+        Small files are read in one call; files of MMAP_THRESHOLD bytes or
+        more are memory-mapped and handed to the hasher without copying.
         
         Args:
             file_path: Path to the file
@@ -51,11 +177,14 @@ class ContentHashComparator:
         try:
             sha256_hash = hashlib.sha256()
             
-            # Read file in chunks to handle large files
             with open(file_path, 'rb') as f:
-                # Read in 64KB chunks
-                for chunk in iter(lambda: f.read(65536), b''):
-                    sha256_hash.update(chunk)
+                if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+                    sha256_hash.update(f.read())
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        sha256_hash.update(mm)
             
             hash_value = sha256_hash.hexdigest()
             self.logger.debug(f"Computed hash for {file_path.name}: {hash_value[:16]}...")
@@ -66,6 +195,21 @@ class ContentHashComparator:
             self.logger.error(f"Failed to read {file_path}: {e}")
             raise
     
+    def compute_bytes_hash(self, data: bytes) -> str:
+        """
+        Compute SHA-256 hash of in-memory content.
+        
+        Matches compute_file_hash for a file holding the same bytes, so
+        content that is still in memory need not be written out to compare it.
+        
+        Args:
+            data: Content to hash
+            
+        Returns:
+            Hexadecimal string representation of SHA-256 hash
+        """
+        return hashlib.sha256(data).hexdigest()
+    
     def decrypt_and_hash(
         self, 
         encrypted_file: Path, 
@@ -74,8 +218,10 @@ class ContentHashComparator:
         """
         Decrypt an encrypted file and compute its content hash.
         
-        Creates a temporary decrypted file, computes hash, then deletes temp file.
-        This ensures we don't leave unencrypted data on disk.
+        Decrypts in memory and hashes the plaintext directly, so no
+        unencrypted data is ever written to disk. With a hash cache, a file
+        whose size, mtime and inode are unchanged since it was last hashed
+        is not decrypted at all.
         
         Args:
             encrypted_file: Path to encrypted file
@@ -88,18 +234,19 @@ class ContentHashComparator:
             self.logger.debug(f"Encrypted file does not exist: {encrypted_file.name}")
             return None
         
-        # Create temporary file path for decryption
-        temp_file = encrypted_file.parent / f".tmp_{encrypted_file.stem}_decrypted"
+        if self._cache is not None:
+            cached = self._cache.get(encrypted_file, password)
+            if cached:
+                self.logger.debug(f"Cached hash for {encrypted_file.name}: {cached[:16]}...")
+                return cached
         
         try:
-            # Decrypt to temporary file
             self.logger.debug(f"Decrypting {encrypted_file.name} for comparison...")
-            self.encryptor.decrypt_file(encrypted_file, temp_file, password)
-            
-            # Compute hash of decrypted content
-            content_hash = self.compute_file_hash(temp_file)
+            plaintext = self.encryptor.decrypt_to_bytes(encrypted_file, password)
+            content_hash = self.compute_bytes_hash(plaintext)
             
             self.logger.debug(f"Existing file hash: {content_hash[:16]}...")
+            self.remember_hash(encrypted_file, content_hash, password)
             
             return content_hash
             
@@ -108,15 +255,6 @@ class ContentHashComparator:
                 f"Failed to decrypt and hash {encrypted_file.name}: {e}"
             )
             return None
-            
-        finally:
-            # Always clean up temporary file
-            if temp_file.exists():
-                try:
-                    temp_file.unlink()
-                    self.logger.debug(f"Cleaned up temporary file: {temp_file.name}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to delete temp file {temp_file.name}: {e}")
     
     def should_write_file(
         self,
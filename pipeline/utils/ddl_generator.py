@@ -47,12 +47,12 @@ def generate_ddl_with_indexes(
     column_definitions.append("    data_inserted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL")
 
     for col in table_metadata["columns"]:
-        col_def = f"    {col['name']} {col['postgres_type']}"
+        col_parts = [f"    {col['name']} {col['postgres_type']}"]
         if not col["is_nullable"]:
-            col_def += " NOT NULL"
+            col_parts.append(" NOT NULL")
         if col["default_value"]:
-            col_def += f" DEFAULT {col['default_value']}"
-        column_definitions.append(col_def)
+            col_parts.append(f" DEFAULT {col['default_value']}")
+        column_definitions.append("".join(col_parts))
 
     ddl_lines.append(",\n".join(column_definitions))
 
@@ -2,6 +2,8 @@
 Metadata Comparator
 Compares table metadata to detect schema changes
 """
+import json
+import hashlib
 from typing import Dict, List, Any
 from pipeline.utils.logger import get_logger
 
@@ -71,6 +73,36 @@ class MetadataComparator:
             "summary": summary
         }
     
+    @staticmethod
+    def schema_fingerprint(metadata: Dict) -> str:
+        """
+        SHA-256 over exactly the fields compare_metadata() inspects
+        
+        Two metadata dicts with the same fingerprint compare as unchanged, so
+        a stored fingerprint lets callers skip loading (and decrypting) the
+        previous metadata. Volatile fields such as ``extracted_at`` and
+        ``statistics`` are excluded.
+        """
+        columns = sorted(
+            [
+                col['name'].upper(),
+                col.get('data_type'),
+                col.get('is_nullable'),
+                col.get('position'),
+            ]
+            for col in metadata.get('columns', [])
+        )
+        constraints = metadata.get('constraints', {})
+        canonical = {
+            "columns": columns,
+            "primary_key": sorted(constraints.get('primary_key', [])),
+            "foreign_keys": constraints.get('foreign_keys', []),
+            "comment": metadata.get('comment', ''),
+            "clustering_key": metadata.get('clustering_key', []),
+        }
+        encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    
     def _compare_columns(self, old_columns: List[Dict], new_columns: List[Dict]):
         """Compare column definitions.
 
@@ -96,8 +128,8 @@ class MetadataComparator:
                 "column": col['name'],
                 "details": {
                     "data_type": col.get('data_type'),
-                    "nullable": col.get('nullable'),
-                    "position": col.get('ordinal_position')
+                    "nullable": col.get('is_nullable'),
+                    "position": col.get('position')
                 }
             })
             logger.info(f"Column added: {col['name']} ({col.get('data_type')})")
@@ -120,7 +152,8 @@ class MetadataComparator:
         for col_key in common_cols:
             old_col = old_cols_dict[col_key]
             new_col = new_cols_dict[col_key]
-            
+            col_name = new_col['name']
+
             # Check type change
             if old_col.get('data_type') != new_col.get('data_type'):
                 self.changes.append({
@@ -134,25 +167,25 @@ class MetadataComparator:
                 logger.info(f"Column type changed: {col_name} ({old_col.get('data_type')} → {new_col.get('data_type')})")
             
             # Check nullable change
-            if old_col.get('nullable') != new_col.get('nullable'):
+            if old_col.get('is_nullable') != new_col.get('is_nullable'):
                 self.changes.append({
                     "type": "column_nullable_changed",
                     "column": col_name,
                     "details": {
-                        "old_nullable": old_col.get('nullable'),
-                        "new_nullable": new_col.get('nullable')
+                        "old_nullable": old_col.get('is_nullable'),
+                        "new_nullable": new_col.get('is_nullable')
                     }
                 })
                 logger.info(f"Column nullable changed: {col_name}")
             
             # Check position change
-            if old_col.get('ordinal_position') != new_col.get('ordinal_position'):
+            if old_col.get('position') != new_col.get('position'):
                 self.changes.append({
                     "type": "column_position_changed",
                     "column": col_name,
                     "details": {
-                        "old_position": old_col.get('ordinal_position'),
-                        "new_position": new_col.get('ordinal_position')
+                        "old_position": old_col.get('position'),
+                        "new_position": new_col.get('position')
                     }
                 })
                 logger.debug(f"Column position changed: {col_name}")
@@ -204,9 +204,8 @@ class MetadataDecryptor:
         Returns:
             List of table names
         """
-        import yaml
-        with open("config/tables.yaml", 'r') as f:
-            config = yaml.safe_load(f)
+        from pipeline.utils.config_loader import load_tables_config
+        config = load_tables_config()
         
         tables = [t['name'] for t in config['tables']]
         return tables
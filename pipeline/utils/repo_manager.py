@@ -27,7 +27,6 @@ import os
 import stat
 import subprocess
 import shutil
-import tempfile
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -144,19 +143,9 @@ class DatasetRepoManager:
                     "Set ENCRYPTION_PASSWORD in .env"
                 )
             from pipeline.transformers.encryptor import FileEncryptor
-            import os
 
             encryptor = FileEncryptor()
-            fd, tmp_name = tempfile.mkstemp(suffix=".json")
-            temp_path = Path(tmp_name)
-            try:
-                os.close(fd)
-                encryptor.decrypt_file(enc_path, temp_path, password)
-                with open(temp_path, "r", encoding="utf-8") as f:
-                    manifest = json.load(f)
-            finally:
-                if temp_path.exists():
-                    temp_path.unlink()
+            manifest = json.loads(encryptor.decrypt_to_bytes(enc_path, password))
 
             logger.info("Read delivery manifest (encrypted)")
             return manifest
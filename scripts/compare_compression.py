@@ -15,6 +15,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 
+import pyarrow.parquet as pq
+
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -23,75 +25,163 @@ from pipeline.transformers.encryptor import FileEncryptor
 from pipeline.connections import SnowflakeConnectionManager
 from pipeline.config.settings import get_settings
 from pipeline.utils.logger import get_logger
-import yaml
+from pipeline.utils.config_loader import load_tables_config
 
 logger = get_logger(__name__)
 
 
-def export_with_config(
+def _new_stats(test_config: dict, chunk_size: int) -> Dict[str, Any]:
+    """Empty statistics record for one configuration"""
+    return {
+        'config_name': test_config['name'],
+        'compression': test_config['compression'],
+        'compression_level': test_config['compression_level'],
+        'optimize_types': test_config['optimize_types'],
+        'chunk_size': chunk_size,
+        'total_rows': 0,
+        'total_chunks': 0,
+        'total_compressed_size': 0,
+        'total_encrypted_size': 0,
+        'total_compression_time': 0,
+        'total_encryption_time': 0,
+        'total_time': 0,
+        'type_optimization_stats': [],
+        'chunks': []
+    }
+
+
+def compress_chunk_with_config(
+    df_chunk,
+    chunk_num: int,
+    test_config: dict,
+    stats: Dict[str, Any],
+    export_dir: Path,
+    extractor: SnowflakeDataExtractor,
+    encryptor: FileEncryptor,
+    password: str
+):
+    """
+    Compress and encrypt one extracted chunk with a specific configuration,
+    adding the results to that configuration's statistics
+    """
+    export_dir.mkdir(parents=True, exist_ok=True)
+
+    # File names
+    parquet_file = export_dir / f"data_chunk_{chunk_num:03d}.parquet"
+    encrypted_file = export_dir / f"data_chunk_{chunk_num:03d}.parquet.enc"
+
+    # Save to Parquet with compression
+    comp_start = time.time()
+    parquet_info = extractor.save_chunk_to_parquet(
+        df_chunk,
+        parquet_file,
+        compression=test_config['compression'],
+        compression_level=test_config['compression_level'],
+        optimize_types=test_config['optimize_types']
+    )
+    comp_time = time.time() - comp_start
+
+    # Layout as written, read back from the Parquet footer only
+    parquet_meta = pq.ParquetFile(str(parquet_file)).metadata
+    row_groups = parquet_meta.num_row_groups
+    first_group = parquet_meta.row_group(0) if row_groups else None
+    dictionary_columns = parquet_info.get('dictionary_columns', 0)
+
+    # Track type optimization stats
+    if 'type_optimization' in parquet_info:
+        stats['type_optimization_stats'].append(parquet_info['type_optimization'])
+
+    # Encrypt file
+    enc_start = time.time()
+    encryption_info = encryptor.encrypt_file(
+        parquet_file,
+        encrypted_file,
+        password
+    )
+    enc_time = time.time() - enc_start
+
+    # Remove unencrypted file
+    parquet_file.unlink()
+
+    stats['total_rows'] += len(df_chunk)
+    stats['total_chunks'] += 1
+    stats['total_compression_time'] += comp_time
+    stats['total_compressed_size'] += parquet_info['size_bytes']
+    stats['total_encryption_time'] += enc_time
+    stats['total_encrypted_size'] += encryption_info['encrypted_size']
+    stats['total_time'] += comp_time + enc_time
+
+    print(
+        f"    {test_config['name']:<32} "
+        f"compressed {parquet_info['size_mb']:.2f} MB in {comp_time:.2f}s, "
+        f"encrypted {encryption_info['encrypted_size'] / (1024*1024):.2f} MB in {enc_time:.2f}s, "
+        f"{row_groups} row group(s), {dictionary_columns} dictionary column(s)"
+    )
+
+    # Store chunk stats
+    stats['chunks'].append({
+        'chunk_number': chunk_num,
+        'rows': len(df_chunk),
+        'compressed_size': parquet_info['size_bytes'],
+        'encrypted_size': encryption_info['encrypted_size'],
+        'compression_time': comp_time,
+        'encryption_time': enc_time,
+        'row_groups': row_groups,
+        'row_group_bytes': first_group.total_byte_size if first_group else 0,
+        'dictionary_columns': dictionary_columns
+    })
+
+
+def run_comparison(
     table_config: dict,
     password: str,
     export_base_dir: str,
     conn_manager: SnowflakeConnectionManager,
     chunk_size: int,
-    compression: str,
-    compression_level: int,
-    optimize_types: bool,
-    config_name: str
-) -> Dict[str, Any]:
+    test_configs: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
     """
-    Export table with specific compression configuration
-    
+    Extract the table once and compress every chunk with each configuration
+
+    Each chunk is pulled from Snowflake a single time and handed to all
+    configurations in turn, so adding a configuration costs only its own
+    compression and encryption, not another full table scan. The
+    configurations still run one after another on each chunk, so their
+    timings are not skewed by competing for the same cores.
+
     Returns:
-        Dictionary with export statistics
+        List of per-configuration statistics (failed configurations omitted)
     """
     table_name = table_config['name']
     sf_config = table_config['snowflake']
-    
-    print(f"\n{'=' * 70}")
-    print(f"TESTING: {config_name}")
-    print(f"{'=' * 70}")
-    print(f"  Compression: {compression} level {compression_level}")
-    print(f"  Type optimization: {'ENABLED' if optimize_types else 'DISABLED'}")
-    print(f"  Chunk size: {chunk_size:,} rows")
-    
-    # Create export directory with config name
-    export_dir = Path(export_base_dir) / f"{table_name}_comparison" / config_name.lower().replace(' ', '_')
-    export_dir.mkdir(parents=True, exist_ok=True)
-    
-    logger.info(f"Export directory: {export_dir}")
-    
+    comparison_dir = Path(export_base_dir) / f"{table_name}_comparison"
+
     # Initialize components
     extractor = SnowflakeDataExtractor(conn_manager)
     encryptor = FileEncryptor()
-    
+
     # Build filter clause
     filter_config = sf_config.get('filter')
     filter_clause = extractor._build_filter_clause(filter_config)
-    
-    # Track statistics
-    stats = {
-        'config_name': config_name,
-        'compression': compression,
-        'compression_level': compression_level,
-        'optimize_types': optimize_types,
-        'chunk_size': chunk_size,
-        'total_rows': 0,
-        'total_chunks': 0,
-        'total_compressed_size': 0,
-        'total_encrypted_size': 0,
-        'total_compression_time': 0,
-        'total_encryption_time': 0,
-        'type_optimization_stats': [],
-        'chunks': []
-    }
-    
+
+    all_stats = [_new_stats(test_config, chunk_size) for test_config in test_configs]
+    export_dirs = [
+        comparison_dir / test_config['name'].lower().replace(' ', '_')
+        for test_config in test_configs
+    ]
+    failed = set()
+
+    for test_config in test_configs:
+        print(f"\n  {test_config['name']}: {test_config['compression']} level "
+              f"{test_config['compression_level']}, type optimization "
+              f"{'ENABLED' if test_config['optimize_types'] else 'DISABLED'}")
+
     # Extract and process chunks
     print(f"\n🔄 Extracting data...")
-    
+
     chunk_num = 0
     start_time = time.time()
-    
+
     for df_chunk in extractor.extract_table_chunks(
         sf_config['database'],
         sf_config['schema'],
@@ -100,79 +190,51 @@ def export_with_config(
         filter_clause=filter_clause
     ):
         chunk_num += 1
-        stats['total_rows'] += len(df_chunk)
-        
-        # File names
-        parquet_file = export_dir / f"data_chunk_{chunk_num:03d}.parquet"
-        encrypted_file = export_dir / f"data_chunk_{chunk_num:03d}.parquet.enc"
-        
         print(f"\n  Chunk {chunk_num}: {len(df_chunk):,} rows")
-        
-        # Save to Parquet with compression
-        comp_start = time.time()
-        parquet_info = extractor.save_chunk_to_parquet(
-            df_chunk,
-            parquet_file,
-            compression=compression,
-            compression_level=compression_level,
-            optimize_types=optimize_types
-        )
-        comp_time = time.time() - comp_start
-        
-        stats['total_compression_time'] += comp_time
-        stats['total_compressed_size'] += parquet_info['size_bytes']
-        
-        print(f"    Compressed: {parquet_info['size_mb']:.2f} MB in {comp_time:.2f}s")
-        
-        # Track type optimization stats
-        if 'type_optimization' in parquet_info:
-            stats['type_optimization_stats'].append(parquet_info['type_optimization'])
-        
-        # Encrypt file
-        enc_start = time.time()
-        encryption_info = encryptor.encrypt_file(
-            parquet_file,
-            encrypted_file,
-            password
-        )
-        enc_time = time.time() - enc_start
-        
-        stats['total_encryption_time'] += enc_time
-        stats['total_encrypted_size'] += encryption_info['encrypted_size']
-        
-        print(f"    Encrypted: {encryption_info['encrypted_size'] / (1024*1024):.2f} MB in {enc_time:.2f}s")
-        
-        # Remove unencrypted file
-        parquet_file.unlink()
-        
-        # Store chunk stats
-        stats['chunks'].append({
-            'chunk_number': chunk_num,
-            'rows': len(df_chunk),
-            'compressed_size': parquet_info['size_bytes'],
-            'encrypted_size': encryption_info['encrypted_size'],
-            'compression_time': comp_time,
-            'encryption_time': enc_time
-        })
-    
-    stats['total_chunks'] = chunk_num
-    stats['total_time'] = time.time() - start_time
-    
-    # Calculate averages
-    if stats['type_optimization_stats']:
-        avg_reduction = sum(s['reduction_pct'] for s in stats['type_optimization_stats']) / len(stats['type_optimization_stats'])
-        stats['avg_type_optimization_reduction'] = avg_reduction
-    
-    print(f"\n✅ {config_name} Complete!")
-    print(f"  Total rows: {stats['total_rows']:,}")
-    print(f"  Total chunks: {stats['total_chunks']}")
-    print(f"  Compressed size: {stats['total_compressed_size'] / (1024*1024):.2f} MB")
-    print(f"  Encrypted size: {stats['total_encrypted_size'] / (1024*1024):.2f} MB")
-    print(f"  Total time: {stats['total_time']:.2f}s")
-    if 'avg_type_optimization_reduction' in stats:
-        print(f"  Avg type optimization: {stats['avg_type_optimization_reduction']:.1f}% reduction")
-    
-    return stats
+
+        for i, test_config in enumerate(test_configs):
+            if i in failed:
+                continue
+            try:
+                compress_chunk_with_config(
+                    df_chunk,
+                    chunk_num,
+                    test_config,
+                    all_stats[i],
+                    export_dirs[i],
+                    extractor,
+                    encryptor,
+                    password
+                )
+            except Exception as e:
+                failed.add(i)
+                logger.error(f"Failed to test {test_config['name']}: {e}")
+                print(f"\n❌ Failed to test {test_config['name']}: {e}")
+
+    print(f"\n  Extracted {chunk_num} chunks in {time.time() - start_time:.2f}s")
+
+    results = []
+    for i, stats in enumerate(all_stats):
+        if i in failed:
+            continue
+
+        # Calculate averages
+        if stats['type_optimization_stats']:
+            avg_reduction = sum(s['reduction_pct'] for s in stats['type_optimization_stats']) / len(stats['type_optimization_stats'])
+            stats['avg_type_optimization_reduction'] = avg_reduction
+
+        print(f"\n✅ {stats['config_name']} Complete!")
+        print(f"  Total rows: {stats['total_rows']:,}")
+        print(f"  Total chunks: {stats['total_chunks']}")
+        print(f"  Compressed size: {stats['total_compressed_size'] / (1024*1024):.2f} MB")
+        print(f"  Encrypted size: {stats['total_encrypted_size'] / (1024*1024):.2f} MB")
+        print(f"  Total time: {stats['total_time']:.2f}s (compression + encryption)")
+        if 'avg_type_optimization_reduction' in stats:
+            print(f"  Avg type optimization: {stats['avg_type_optimization_reduction']:.1f}% reduction")
+
+        results.append(stats)
+
+    return results
 
 
 def print_comparison_table(all_stats: List[Dict[str, Any]]):
@@ -258,8 +320,7 @@ def main():
         password = settings.encryption_password
         
         # Load table configuration
-        with open("config/tables.yaml", 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_tables_config()
         
         table_config = next(
             (t for t in config['tables'] if t['name'] == args.table),
@@ -317,27 +378,15 @@ def main():
         with SnowflakeConnectionManager() as conn_manager:
             print("✅ Connected to Snowflake")
             
-            # Run tests
-            all_stats = []
-            
-            for test_config in test_configs:
-                try:
-                    stats = export_with_config(
-                        table_config,
-                        password,
-                        export_base_dir,
-                        conn_manager,
-                        args.chunk_size,
-                        test_config['compression'],
-                        test_config['compression_level'],
-                        test_config['optimize_types'],
-                        test_config['name']
-                    )
-                    all_stats.append(stats)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to test {test_config['name']}: {e}")
-                    print(f"\n❌ Failed to test {test_config['name']}: {e}")
+            # Run tests over a single extraction
+            all_stats = run_comparison(
+                table_config,
+                password,
+                export_base_dir,
+                conn_manager,
+                args.chunk_size,
+                test_configs
+            )
             
             # Print comparison
             if len(all_stats) > 1:
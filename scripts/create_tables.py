@@ -14,7 +14,6 @@ Usage:
 import sys
 import argparse
 import json
-import tempfile
 from pathlib import Path
 
 # Add project root to path
@@ -25,7 +24,7 @@ from pipeline.transformers.encryptor import FileEncryptor
 from pipeline.transformers.obfuscator import DataObfuscator, MetadataObfuscator
 from pipeline.config.settings import get_settings
 from pipeline.utils.logger import get_logger
-import yaml
+from pipeline.utils.config_loader import load_tables_config
 
 logger = get_logger(__name__)
 
@@ -95,97 +94,82 @@ def create_table(table_name: str, drop_if_exists: bool = False, password: str =
             print(f"✅ Found encrypted metadata: {encrypted_metadata_file.name}")
             print(f"✅ Found encrypted DDL: {encrypted_ddl_file.name}")
             
-            # Decrypt files to temporary location
+            # Decrypt files in memory
             print(f"\n🔓 Decrypting files...")
             
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_dir_path = Path(temp_dir)
-                
-                # Decrypt metadata
-                temp_metadata = temp_dir_path / f"{table_name}_metadata.json"
-                encryptor.decrypt_file(encrypted_metadata_file, temp_metadata, password)
-                print(f"   ✅ Decrypted metadata")
-                
-                # Decrypt DDL
-                temp_ddl = temp_dir_path / f"{table_name}_create.sql"
-                encryptor.decrypt_file(encrypted_ddl_file, temp_ddl, password)
-                print(f"   ✅ Decrypted DDL")
-                
-                # Load decrypted metadata
-                with open(temp_metadata, 'r') as f:
-                    metadata = json.load(f)
+            # Decrypt metadata
+            metadata = json.loads(encryptor.decrypt_to_bytes(encrypted_metadata_file, password))
+            print(f"   ✅ Decrypted metadata")
+            
+            # Decrypt DDL
+            ddl = encryptor.decrypt_to_bytes(encrypted_ddl_file, password).decode('utf-8')
+            print(f"   ✅ Decrypted DDL")
+            
+            # Snowflake default VARCHAR(16777216) exceeds PostgreSQL max (10485760) -- use TEXT
+            import re
+            ddl = re.sub(
+                r'VARCHAR\((\d+)\)',
+                lambda m: 'TEXT' if int(m.group(1)) > 10485760 else m.group(0),
+                ddl,
+            )
+            
+            # Extract schema and table from DDL
+            match = re.search(r'CREATE TABLE IF NOT EXISTS (\w+)\.(\w+)', ddl)
+            if match:
+                schema = match.group(1)
+                table = match.group(2)
+            else:
+                print(f"❌ Could not parse schema/table from DDL")
+                return False
+            
+            print(f"\n🔄 Creating table {schema}.{table}...")
+            
+            # Create PostgreSQL connection and execute DDL
+            import psycopg2
+            from pipeline.config.settings import get_postgres_connection_params
+            
+            conn_params = get_postgres_connection_params()
+            conn = psycopg2.connect(**conn_params)
+            cursor = conn.cursor()
+            
+            try:
+                # Create schema if it doesn't exist
+                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
                 
-                # Load decrypted DDL
-                with open(temp_ddl, 'r') as f:
-                    ddl = f.read()
+                # Drop table if requested
+                if drop_if_exists:
+                    cursor.execute(f"DROP TABLE IF EXISTS {schema}.{table} CASCADE")
+                    print(f"   Dropped existing table {schema}.{table}")
                 
-                # Snowflake default VARCHAR(16777216) exceeds PostgreSQL max (10485760) -- use TEXT
-                import re
-                ddl = re.sub(
-                    r'VARCHAR\((\d+)\)',
-                    lambda m: 'TEXT' if int(m.group(1)) > 10485760 else m.group(0),
-                    ddl,
-                )
+                # Execute DDL
+                cursor.execute(ddl)
+                conn.commit()
                 
-                # Extract schema and table from DDL
-                match = re.search(r'CREATE TABLE IF NOT EXISTS (\w+)\.(\w+)', ddl)
-                if match:
-                    schema = match.group(1)
-                    table = match.group(2)
-                else:
-                    print(f"❌ Could not parse schema/table from DDL")
-                    return False
+                print(f"\n✅ Table created successfully!")
+                print(f"   Schema: {schema}")
+                print(f"   Table: {table}")
+                print(f"   Columns: {len(metadata['columns']) + 1} (including data_inserted_at)")
                 
-                print(f"\n🔄 Creating table {schema}.{table}...")
+                # Get table info
+                cursor.execute(f"""
+                    SELECT (SELECT COUNT(*) FROM {schema}.{table}),
+                           pg_size_pretty(pg_total_relation_size('{schema}.{table}'))
+                """)
+                row_count, table_size = cursor.fetchone()
                 
-                # Create PostgreSQL connection and execute DDL
-                import psycopg2
-                from pipeline.config.settings import get_postgres_connection_params
+                print(f"\n📊 Table info:")
+                print(f"   Rows: {row_count:,}")
+                print(f"   Size: {table_size}")
                 
-                conn_params = get_postgres_connection_params()
-                conn = psycopg2.connect(**conn_params)
-                cursor = conn.cursor()
+                return True
                 
-                try:
-                    # Create schema if it doesn't exist
-                    cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
-                    
-                    # Drop table if requested
-                    if drop_if_exists:
-                        cursor.execute(f"DROP TABLE IF EXISTS {schema}.{table} CASCADE")
-                        print(f"   Dropped existing table {schema}.{table}")
-                    
-                    # Execute DDL
-                    cursor.execute(ddl)
-                    conn.commit()
-                    
-                    print(f"\n✅ Table created successfully!")
-                    print(f"   Schema: {schema}")
-                    print(f"   Table: {table}")
-                    print(f"   Columns: {len(metadata['columns']) + 1} (including data_inserted_at)")
-                    
-                    # Get table info
-                    cursor.execute(f'SELECT COUNT(*) FROM {schema}.{table}')
-                    row_count = cursor.fetchone()[0]
-                    
-                    cursor.execute(f"""
-                        SELECT pg_size_pretty(pg_total_relation_size('{schema}.{table}'))
-                    """)
-                    table_size = cursor.fetchone()[0]
-                    
-                    print(f"\n📊 Table info:")
-                    print(f"   Rows: {row_count:,}")
-                    print(f"   Size: {table_size}")
-                    
-                    return True
-                    
-                except Exception as e:
-                    conn.rollback()
-                    print(f"\n❌ Failed to create table: {e}")
-                    return False
-                finally:
-                    cursor.close()
-                    conn.close()
+            except Exception as e:
+                conn.rollback()
+                print(f"\n❌ Failed to create table: {e}")
+                return False
+            finally:
+                cursor.close()
+                conn.close()
         
         else:
             # Files are not encrypted - use original logic
@@ -222,13 +206,11 @@ def create_table(table_name: str, drop_if_exists: bool = False, password: str =
             conn = psycopg2.connect(**conn_params)
             cursor = conn.cursor()
             
-            cursor.execute(f"SELECT COUNT(*) FROM {result['schema']}.{result['table']}")
-            row_count = cursor.fetchone()[0]
-            
             cursor.execute(f"""
-                SELECT pg_size_pretty(pg_total_relation_size('{result['schema']}.{result['table']}'))
+                SELECT (SELECT COUNT(*) FROM {result['schema']}.{result['table']}),
+                       pg_size_pretty(pg_total_relation_size('{result['schema']}.{result['table']}'))
             """)
-            table_size = cursor.fetchone()[0]
+            row_count, table_size = cursor.fetchone()
             
             print(f"\n📊 Table info:")
             print(f"   Rows: {row_count:,}")
@@ -266,8 +248,7 @@ def create_all_tables(drop_if_exists: bool = False, password: str = None):
         print(f"   Make sure config/tables.yaml is transferred to this server")
         return False
     
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_tables_config(config_file)
     
     tables = config.get('tables', [])
     
@@ -12,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from pipeline.utils.metadata_decryptor import MetadataDecryptor
 from pipeline.utils.change_logger import ChangeLogger
 from pipeline.utils.logger import get_logger
+from pipeline.utils.config_loader import load_tables_config
 from pipeline.config.settings import get_settings
 
 logger = get_logger(__name__)
@@ -131,9 +132,7 @@ def list_tables(decryptor: MetadataDecryptor, password: str):
     logger.info("Listing available tables from config/tables.yaml...")
     
     try:
-        import yaml
-        with open("config/tables.yaml", 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_tables_config()
         
         tables = [t['name'] for t in config['tables']]
         
@@ -157,9 +156,7 @@ def decrypt_all_tables(decryptor: MetadataDecryptor, password: str, show_changes
     logger.info("Decrypting all tables from config/tables.yaml...")
     
     try:
-        import yaml
-        with open("config/tables.yaml", 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_tables_config()
         
         tables = [t['name'] for t in config['tables']]
         results = {}
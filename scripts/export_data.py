@@ -12,7 +12,6 @@ Usage:
 import sys
 import json
 import argparse
-import hashlib
 import logging
 import shutil
 import time
@@ -33,7 +32,7 @@ from pipeline.connections import SnowflakeConnectionManager
 from pipeline.state.watermark_manager import WatermarkManager
 from pipeline.config.settings import get_settings
 from pipeline.utils.logger import get_logger
-import yaml
+from pipeline.utils.config_loader import load_tables_config
 
 logger = get_logger(__name__)
 
@@ -107,7 +106,7 @@ def export_table(
     encryptor = FileEncryptor()
     
     from pipeline.utils.content_hash_comparator import ContentHashComparator
-    comparator = ContentHashComparator(encryptor)
+    comparator = ContentHashComparator(encryptor, cache_dir=get_settings().state_dir)
     
     stats = ExportStatistics()
     
@@ -225,6 +224,7 @@ def export_table(
             encryption_info = encryptor.encrypt_file(
                 parquet_file, encrypted_file, password
             )
+            comparator.remember_hash(encrypted_file, content_hash, password)
             
             chunk_metadata = {
                 "chunk_number": chunk_num,
@@ -296,7 +296,7 @@ def export_table(
     
     # Compute manifest content hash for change detection
     manifest_json = json.dumps(manifest, indent=2, sort_keys=True)
-    manifest_hash = hashlib.sha256(manifest_json.encode('utf-8')).hexdigest()
+    manifest_bytes = manifest_json.encode('utf-8')
     
     # Save manifest (encrypted if obfuscation enabled, plain if not)
     manifest_file_id = None
@@ -311,13 +311,7 @@ def export_table(
         if manifest_file.exists():
             existing_manifest_hash = comparator.decrypt_and_hash(manifest_file, password)
             if existing_manifest_hash:
-                # Create temp file to compute hash of new manifest
-                temp_manifest = export_dir / "manifest.json.tmp"
-                with open(temp_manifest, 'w') as f:
-                    f.write(manifest_json)
-                
-                new_manifest_hash = comparator.compute_file_hash(temp_manifest)
-                temp_manifest.unlink()
+                new_manifest_hash = comparator.compute_bytes_hash(manifest_bytes)
                 
                 if new_manifest_hash == existing_manifest_hash:
                     manifest_needs_write = False
@@ -326,8 +320,7 @@ def export_table(
         if manifest_needs_write:
             # Save as temporary JSON
             temp_manifest = export_dir / "manifest.json.tmp"
-            with open(temp_manifest, 'w') as f:
-                f.write(manifest_json)
+            temp_manifest.write_bytes(manifest_bytes)
             
             logger.debug(f"Encrypting manifest as {manifest_file.name}")
             encryptor.encrypt_file(temp_manifest, manifest_file, password)
@@ -344,13 +337,7 @@ def export_table(
         if manifest_file.exists():
             try:
                 existing_hash = comparator.compute_file_hash(manifest_file)
-                # Create temp file to compute hash of new manifest
-                temp_manifest = export_dir / "manifest.json.tmp"
-                with open(temp_manifest, 'w') as f:
-                    f.write(manifest_json)
-                
-                new_hash = comparator.compute_file_hash(temp_manifest)
-                temp_manifest.unlink()
+                new_hash = comparator.compute_bytes_hash(manifest_bytes)
                 
                 if new_hash == existing_hash:
                     manifest_needs_write = False
@@ -360,11 +347,12 @@ def export_table(
                 manifest_needs_write = True
         
         if manifest_needs_write:
-            with open(manifest_file, 'w') as f:
-                f.write(manifest_json)
+            manifest_file.write_bytes(manifest_bytes)
             
             logger.info(f"Manifest saved: {manifest_file}")
     
+    comparator.save_cache()
+    
     # Update statistics
     stats.manifest_written = manifest_needs_write
     
@@ -518,8 +506,7 @@ def main():
         password = settings.encryption_password
         
         # Load table configuration
-        with open("config/tables.yaml", 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_tables_config()
         
         obfuscator = DataObfuscator() if use_obfuscation else None
         
@@ -11,25 +11,41 @@ Usage:
     python scripts/import_data.py --table financial_data --from-bundle bundles/delta_20260402.bundle
     python scripts/import_data.py --table financial_data --from-archive exports/TABLE.tar.gz
 """
+import io
+import os
 import sys
 import json
+import queue
+import hashlib
 import argparse
+import contextlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from pipeline.transformers.encryptor import FileEncryptor
-from pipeline.transformers.obfuscator import DataObfuscator
-from pipeline.loaders.data_loader import PostgreSQLDataLoader, ChunkCheckpoint
 from pipeline.config.settings import get_settings
+from pipeline.utils.config_loader import load_tables_config
 from pipeline.utils.logger import get_logger
-import yaml
-import tempfile
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib parser is the fallback
+    orjson = None
+
+if TYPE_CHECKING:
+    from pipeline.transformers.encryptor import FileEncryptor
+    from pipeline.transformers.obfuscator import DataObfuscator
+    from pipeline.loaders.data_loader import PostgreSQLDataLoader
 
 logger = get_logger(__name__)
 
 
-def _resolve_import_dir(table_name: str, search_dirs) -> tuple:
+def _resolve_import_dir(
+    table_name: str, search_dirs, obfuscator: Optional["DataObfuscator"] = None
+) -> tuple:
     """
     Search one or more base directories for a table's export folder.
 
@@ -38,7 +54,10 @@ def _resolve_import_dir(table_name: str, search_dirs) -> tuple:
     if isinstance(search_dirs, (str, Path)):
         search_dirs = [search_dirs]
 
-    obfuscator = DataObfuscator()
+    if obfuscator is None:
+        from pipeline.transformers.obfuscator import DataObfuscator
+
+        obfuscator = DataObfuscator()
     folder_id = obfuscator.generate_folder_id(table_name)
     tried = []
 
@@ -64,6 +83,125 @@ def _resolve_import_dir(table_name: str, search_dirs) -> tuple:
     )
 
 
+def _json_loads(data: bytes):
+    """
+    Parse JSON bytes with orjson when installed, else the stdlib parser.
+
+    Falls back to json.loads on documents orjson rejects but the stdlib
+    writer can produce (e.g. NaN), so results never depend on orjson.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _write_lines(lines):
+    """Write a block of report lines to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _readahead(path: Path):
+    """
+    Hint the kernel to start reading a file into the page cache.
+
+    Lets the device service several upcoming chunk reads at once instead of
+    one synchronous read per chunk. No-op where posix_fadvise is unavailable
+    (e.g. Windows).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def _decrypt_and_verify(
+    encryptor: "FileEncryptor",
+    chunk_info: dict,
+    import_dir: Path,
+    password: str,
+    keep_decrypted: bool = False,
+) -> io.BytesIO:
+    """
+    Decrypt one chunk and verify its checksum.
+
+    Runs on a worker thread so the next chunk is ready by the time the
+    previous one has been loaded into PostgreSQL. The plaintext is hashed
+    in memory and handed to the loader as a file-like object; with
+    keep_decrypted it is also written out, but never read back.
+
+    Returns:
+        In-memory buffer over the plaintext
+    """
+    chunk_num = chunk_info["chunk_number"]
+    encrypted_file = import_dir / chunk_info["file"]
+
+    if not encrypted_file.exists():
+        raise FileNotFoundError(f"Encrypted file not found: {encrypted_file}")
+
+    decrypted_file = import_dir / f"data_chunk_{chunk_num:03d}.parquet"
+
+    try:
+        plaintext = encryptor.decrypt_to_bytes(encrypted_file, password)
+    except Exception as e:
+        if "authentication" in str(e).lower():
+            logger.error(f"Decryption of chunk {chunk_num} failed - wrong password or corrupted file")
+            raise ValueError("Wrong password or corrupted file")
+        raise
+
+    actual_checksum = hashlib.sha256(plaintext).hexdigest()
+    if actual_checksum != chunk_info["checksum_sha256"]:
+        logger.error(f"Checksum mismatch for {encrypted_file.name}")
+        logger.error(f"  Expected: {chunk_info['checksum_sha256']}")
+        logger.error(f"  Actual: {actual_checksum}")
+        raise ValueError(f"Checksum mismatch for chunk {chunk_num}")
+    logger.info(f"Checksum verified for {encrypted_file.name}")
+
+    if keep_decrypted:
+        # Written for inspection only; the load reads the same bytes from
+        # memory rather than reading the file straight back
+        decrypted_file.write_bytes(plaintext)
+
+    buffer = io.BytesIO(plaintext)
+    buffer.name = decrypted_file.name
+    return buffer
+
+
+def _load_chunk(
+    loaders: "queue.Queue",
+    decrypted: io.BytesIO,
+    pg_config: dict,
+    sync_mode: str,
+    merge_keys: list,
+) -> dict:
+    """
+    Load one decrypted chunk on whichever loader is free.
+
+    Each loader holds its own PostgreSQL connection, so chunks loaded
+    through the queue from several threads COPY concurrently.
+    """
+    loader = loaders.get()
+    try:
+        return loader.load_parquet_to_table(
+            decrypted,
+            pg_config["schema"],
+            pg_config["table"],
+            sync_mode=sync_mode,
+            merge_keys=merge_keys,
+        )
+    finally:
+        loaders.put(loader)
+
+
 def import_table(
     table_config: dict,
     password: str,
@@ -71,7 +209,15 @@ def import_table(
     truncate_first: bool = False,
     keep_decrypted: bool = False,
     resume: bool = True,
+    loader: Optional["PostgreSQLDataLoader"] = None,
+    encryptor: Optional["FileEncryptor"] = None,
+    obfuscator: Optional["DataObfuscator"] = None,
+    extra_loaders: Optional[List["PostgreSQLDataLoader"]] = None,
 ):
+    from pipeline.transformers.encryptor import FileEncryptor
+    from pipeline.transformers.obfuscator import DataObfuscator
+    from pipeline.loaders.data_loader import PostgreSQLDataLoader, ChunkCheckpoint
+
     table_name = table_config["name"]
     pg_config = table_config["postgres"]
     sync_mode = table_config.get("sync_mode", "full")
@@ -81,9 +227,15 @@ def import_table(
     print(f"IMPORTING TABLE: {table_name}  [sync_mode={sync_mode}]")
     print("=" * 70)
 
+    # main() passes in one encryptor and obfuscator for the whole run
+    if encryptor is None:
+        encryptor = FileEncryptor()
+    if obfuscator is None:
+        obfuscator = DataObfuscator()
+
     # Resolve import directory (searches plain and obfuscated names
     # across all provided base directories)
-    import_dir, obfuscated = _resolve_import_dir(table_name, import_base_dir)
+    import_dir, obfuscated = _resolve_import_dir(table_name, import_base_dir, obfuscator)
     if obfuscated:
         print(f"Found obfuscated folder: {import_dir.name}")
     else:
@@ -92,7 +244,7 @@ def import_table(
     logger.info(f"Import directory: {import_dir}")
 
     # Read manifest
-    manifest = _load_manifest(import_dir, table_name, password, obfuscated)
+    manifest = _load_manifest(import_dir, table_name, password, obfuscated, encryptor, obfuscator)
 
     print(f"\n  Export date: {manifest['export_timestamp']}")
     print(f"  Total rows: {manifest['total_rows']:,}")
@@ -100,14 +252,22 @@ def import_table(
     sf_filter = manifest.get("snowflake_source", {}).get("filter")
     print(f"  Filter: {sf_filter or 'None (all data)'}")
 
-    encryptor = FileEncryptor()
-    loader = PostgreSQLDataLoader()
+    if loader is None:
+        loader = PostgreSQLDataLoader()
     checkpoint = ChunkCheckpoint(checkpoint_dir=get_settings().state_dir) if resume else None
     loaded_chunks = checkpoint.get_loaded_chunks(table_name) if checkpoint else set()
 
-    if truncate_first or sync_mode == "full":
-        print(f"\n  Truncating {pg_config['schema']}.{pg_config['table']}...")
-        loader.truncate_table(pg_config["schema"], pg_config["table"])
+    truncate = truncate_first or sync_mode == "full"
+    # A truncating, non-upsert load runs as one transaction: TRUNCATE plus
+    # COPY ... FREEZE of every chunk, committed once at the end.
+    bulk_load = truncate and not (sync_mode == "upsert" and merge_keys)
+
+    if truncate:
+        if bulk_load:
+            print(f"\n  Truncating {pg_config['schema']}.{pg_config['table']} (in the load transaction)...")
+        else:
+            print(f"\n  Truncating {pg_config['schema']}.{pg_config['table']}...")
+            loader.truncate_table(pg_config["schema"], pg_config["table"])
         if checkpoint:
             checkpoint.clear(table_name)
             loaded_chunks = set()
@@ -115,57 +275,125 @@ def import_table(
     print(f"\n  Processing {manifest['total_chunks']} chunks...")
 
     total_loaded = 0
-    temp_files = []
+    pending = []
+    resumed_lines = []
 
     for chunk_info in manifest["chunks"]:
         chunk_num = chunk_info["chunk_number"]
-        encrypted_file = import_dir / chunk_info["file"]
-
         if chunk_num in loaded_chunks:
-            print(f"\n  Chunk {chunk_num}/{manifest['total_chunks']}: already loaded (resume)")
+            resumed_lines.append(f"\n  Chunk {chunk_num}/{manifest['total_chunks']}: already loaded (resume)")
             total_loaded += chunk_info["rows"]
-            continue
-
-        print(f"\n  Chunk {chunk_num}/{manifest['total_chunks']}:")
-        print(f"   File: {encrypted_file.name}")
-        print(f"   Rows: {chunk_info['rows']:,}")
+        else:
+            pending.append(chunk_info)
+
+    if resumed_lines:
+        _write_lines(resumed_lines)
+
+    # Decrypt/verify the next chunks on worker threads while earlier ones
+    # are being loaded.
+    prefetch = max(1, get_settings().import_prefetch_chunks)
+    in_flight = deque()
+    next_index = 0
+
+    # Plain appends are independent per chunk, so they are COPYed over
+    # several connections at once. A bulk load must stay in its single
+    # transaction and upserts would contend on the merge-key constraint,
+    # so those load one chunk at a time.
+    copy_workers = max(1, get_settings().import_copy_connections)
+    if bulk_load or (sync_mode == "upsert" and merge_keys):
+        copy_workers = 1
+    copy_workers = min(copy_workers, max(1, len(pending)), 1 + len(extra_loaders or []))
+    extra_loaders = (extra_loaders or [])[:copy_workers - 1]
+    loaders = queue.Queue()
+    for pooled in [loader] + extra_loaders:
+        loaders.put(pooled)
+    copying = deque()
+
+    bulk_ctx = (
+        loader.begin_bulk_load(pg_config["schema"], pg_config["table"])
+        if bulk_load
+        else contextlib.nullcontext()
+    )
 
-        if not encrypted_file.exists():
-            raise FileNotFoundError(f"Encrypted file not found: {encrypted_file}")
+    with bulk_ctx as bulk, ThreadPoolExecutor(max_workers=prefetch) as executor, \
+            ThreadPoolExecutor(max_workers=copy_workers) as copy_executor:
 
-        decrypted_file = import_dir / f"data_chunk_{chunk_num:03d}.parquet"
-        print("   Decrypting...")
+        def _submit_next():
+            nonlocal next_index
+            if next_index >= len(pending):
+                return
+            chunk_info = pending[next_index]
+            future = executor.submit(
+                _decrypt_and_verify, encryptor, chunk_info, import_dir, password, keep_decrypted
+            )
+            in_flight.append((chunk_info, future))
+            next_index += 1
+            # Warm the page cache one window beyond what the workers are reading
+            ahead = next_index + prefetch - 1
+            if ahead < len(pending):
+                _readahead(import_dir / pending[ahead]["file"])
+
+        def _finish_oldest_load():
+            nonlocal total_loaded
+            chunk_info, lines, load_future = copying.popleft()
+            # Report each chunk with a single write once it is done (or failed)
+            try:
+                load_info = load_future.result()
+                total_loaded += load_info["rows_loaded"]
+                method = load_info.get("method", "copy")
+                lines.append(f"   Loaded {load_info['rows_loaded']:,} rows [{method}]")
+            finally:
+                _write_lines(lines)
+
+            # Bulk loads commit (or roll back) as a whole, so per-chunk
+            # checkpoints would claim rows that may never be committed
+            if checkpoint and not bulk:
+                checkpoint.mark_chunk_loaded(table_name, chunk_info["chunk_number"])
+
+        for _ in range(prefetch):
+            _submit_next()
 
         try:
-            encryptor.decrypt_file(encrypted_file, decrypted_file, password)
-        except Exception as e:
-            if "authentication" in str(e).lower():
-                print("\n   Decryption failed - wrong password or corrupted file")
-                raise ValueError("Wrong password or corrupted file")
+            while in_flight:
+                chunk_info, future = in_flight.popleft()
+                lines = [
+                    f"\n  Chunk {chunk_info['chunk_number']}/{manifest['total_chunks']}:",
+                    f"   File: {chunk_info['file']}",
+                    f"   Rows: {chunk_info['rows']:,}",
+                    "   Decrypting and verifying checksum...",
+                ]
+                try:
+                    decrypted = future.result()
+                except BaseException:
+                    _write_lines(lines)
+                    raise
+                _submit_next()
+
+                lines.append("   Loading to PostgreSQL...")
+                if bulk:
+                    load_future = copy_executor.submit(bulk.load_parquet, decrypted)
+                else:
+                    load_future = copy_executor.submit(
+                        _load_chunk, loaders, decrypted, pg_config, sync_mode, merge_keys
+                    )
+                copying.append((chunk_info, lines, load_future))
+
+                if len(copying) >= copy_workers:
+                    _finish_oldest_load()
+
+            while copying:
+                _finish_oldest_load()
+        except BaseException:
+            for _, future in in_flight:
+                future.cancel()
+            # Checkpoint appends that still commit so a resume skips them
+            for chunk_info, _, load_future in copying:
+                if load_future.cancel() or load_future.exception() is not None:
+                    continue
+                if checkpoint and not bulk:
+                    checkpoint.mark_chunk_loaded(table_name, chunk_info["chunk_number"])
             raise
 
-        print("   Verifying checksum...")
-        if not encryptor.verify_checksum(decrypted_file, chunk_info["checksum_sha256"]):
-            raise ValueError(f"Checksum mismatch for chunk {chunk_num}")
-
-        temp_files.append(decrypted_file)
-
-        print("   Loading to PostgreSQL...")
-        load_info = loader.load_parquet_to_table(
-            decrypted_file,
-            pg_config["schema"],
-            pg_config["table"],
-            sync_mode=sync_mode,
-            merge_keys=merge_keys,
-        )
-
-        total_loaded += load_info["rows_loaded"]
-        method = load_info.get("method", "copy")
-        print(f"   Loaded {load_info['rows_loaded']:,} rows [{method}]")
-
-        if checkpoint:
-            checkpoint.mark_chunk_loaded(table_name, chunk_num)
-
     # Verify row count (meaningful for full/truncate loads)
     if sync_mode == "full" or truncate_first:
         print("\n  Verifying row count...")
@@ -174,13 +402,6 @@ def import_table(
         else:
             print("  Row count mismatch - check logs")
 
-    # Cleanup
-    if not keep_decrypted:
-        for temp_file in temp_files:
-            if temp_file.exists():
-                temp_file.unlink()
-        print(f"\n  Removed {len(temp_files)} temporary files")
-
     if checkpoint:
         checkpoint.clear(table_name)
 
@@ -195,32 +416,62 @@ def import_table(
     print("=" * 70)
 
 
-def _load_manifest(import_dir: Path, table_name: str, password: str, obfuscated: bool) -> dict:
+def _load_manifest(
+    import_dir: Path,
+    table_name: str,
+    password: str,
+    obfuscated: bool,
+    encryptor: Optional["FileEncryptor"] = None,
+    obfuscator: Optional["DataObfuscator"] = None,
+) -> dict:
     """Locate and load the export manifest (plain or encrypted)."""
     manifest_file = import_dir / "manifest.json"
     if manifest_file.exists():
-        with open(manifest_file, "r") as f:
-            return json.load(f)
+        with open(manifest_file, "rb") as f:
+            return _json_loads(f.read())
 
     if not obfuscated:
         raise FileNotFoundError(f"Manifest file not found: {manifest_file}")
 
-    encryptor = FileEncryptor()
-    for enc_file in import_dir.glob("*.enc"):
-        if enc_file.stat().st_size > 1024 * 1024:
-            continue
+    if encryptor is None:
+        from pipeline.transformers.encryptor import FileEncryptor
+
+        encryptor = FileEncryptor()
+    if obfuscator is None:
+        from pipeline.transformers.obfuscator import DataObfuscator
+
+        obfuscator = DataObfuscator()
+
+    # The exporter names the encrypted manifest deterministically, so it can
+    # be opened directly
+    manifest_file = import_dir / f"{obfuscator.generate_manifest_id(table_name)}.enc"
+    if manifest_file.exists():
+        content = _json_loads(encryptor.decrypt_to_bytes(manifest_file, password))
+        if content.get("table_name") == table_name:
+            return content
+
+    # Fall back to trial decryption, e.g. for exports made with another salt
+    logger.warning(f"Manifest {manifest_file.name} not found; scanning {import_dir} for it")
+    # The manifest is usually the smallest file in the folder, so try the
+    # candidates smallest first
+    candidates = sorted(
+        (enc_file.stat().st_size, enc_file)
+        for enc_file in import_dir.glob("*.enc")
+        if enc_file != manifest_file
+    )
+    table_key = table_name.encode()
+    for size, enc_file in candidates:
+        if size > 1024 * 1024:
+            break
         try:
-            with tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False) as tmp:
-                temp_path = Path(tmp.name)
-            encryptor.decrypt_file(enc_file, temp_path, password)
-            with open(temp_path, "r") as f:
-                content = json.load(f)
-            temp_path.unlink()
+            plaintext = encryptor.decrypt_to_bytes(enc_file, password)
+            # Only parse candidates that can contain this table's name
+            if table_key not in plaintext:
+                continue
+            content = _json_loads(plaintext)
             if content.get("table_name") == table_name:
                 return content
         except Exception:
-            if temp_path.exists():
-                temp_path.unlink()
             continue
 
     raise FileNotFoundError(f"Encrypted manifest not found for table: {table_name}")
@@ -310,6 +561,22 @@ def main():
         print("Error: Must specify either --table <name>, --all, or --pull")
         sys.exit(1)
 
+    from pipeline.transformers.encryptor import FileEncryptor
+    from pipeline.transformers.obfuscator import DataObfuscator
+    from pipeline.loaders.data_loader import PostgreSQLDataLoader
+
+    # One loader (and one PostgreSQL session), encryptor and obfuscator for
+    # every table in the run (every chunk has its own salt, so PBKDF2 still
+    # runs once per chunk), plus the extra COPY connections
+    # used for parallel appends
+    loader = PostgreSQLDataLoader()
+    extra_loaders = [
+        PostgreSQLDataLoader()
+        for _ in range(max(1, get_settings().import_copy_connections) - 1)
+    ]
+    encryptor = FileEncryptor()
+    obfuscator = DataObfuscator()
+
     try:
         settings = get_settings()
         import_base_dir = settings.import_base_dir
@@ -351,6 +618,10 @@ def main():
                         truncate_first=args.truncate,
                         keep_decrypted=args.keep_decrypted,
                         resume=not args.no_resume,
+                        loader=loader,
+                        encryptor=encryptor,
+                        obfuscator=obfuscator,
+                        extra_loaders=extra_loaders,
                     )
                 except Exception as e:
                     logger.error(f"Failed to import {entry['name']}: {e}")
@@ -366,11 +637,11 @@ def main():
         elif args.from_archive:
             import_base_dir = _prepare_from_archive(args.from_archive, settings)
 
-        with open("config/tables.yaml", "r") as f:
-            config = yaml.safe_load(f)
+        config = load_tables_config()
+        tables_by_name = {t["name"]: t for t in config["tables"]}
 
         if args.table:
-            table_config = next((t for t in config["tables"] if t["name"] == args.table), None)
+            table_config = tables_by_name.get(args.table)
             if not table_config:
                 print(f"Error: Table '{args.table}' not found in config/tables.yaml")
                 sys.exit(1)
@@ -381,6 +652,10 @@ def main():
                 truncate_first=args.truncate,
                 keep_decrypted=args.keep_decrypted,
                 resume=not args.no_resume,
+                loader=loader,
+                encryptor=encryptor,
+                obfuscator=obfuscator,
+                extra_loaders=extra_loaders,
             )
         else:
             print(f"\n{'=' * 70}")
@@ -395,6 +670,10 @@ def main():
                         truncate_first=args.truncate,
                         keep_decrypted=args.keep_decrypted,
                         resume=not args.no_resume,
+                        loader=loader,
+                        encryptor=encryptor,
+                        obfuscator=obfuscator,
+                        extra_loaders=extra_loaders,
                     )
                 except Exception as e:
                     logger.error(f"Failed to import {table_config['name']}: {e}")
@@ -410,6 +689,10 @@ def main():
         logger.error(f"Import failed: {e}")
         print(f"\n  Import failed: {e}")
         sys.exit(1)
+    finally:
+        loader.close()
+        for pooled in extra_loaders:
+            pooled.close()
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ View metadata change history for tables
 """
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -231,12 +232,11 @@ def show_summary(change_logger: ChangeLogger):
         print("\nNo change logs found")
         return
     
-    # Get summary for each table
-    summaries = []
-    for log_file in log_files:
-        table_name = log_file.stem.replace('_changes', '')
-        summary = change_logger.get_change_summary(table_name)
-        summaries.append(summary)
+    # Get summary for each table; the logs are independent files, so read
+    # them concurrently
+    table_names = [log_file.stem.replace('_changes', '') for log_file in log_files]
+    with ThreadPoolExecutor(max_workers=min(8, len(table_names))) as executor:
+        summaries = list(executor.map(change_logger.get_change_summary, table_names))
     
     # Sort by total changes (descending)
     summaries.sort(key=lambda x: x['total_changes'], reverse=True)
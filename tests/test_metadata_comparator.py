@@ -0,0 +1,44 @@
+"""
+Tests for MetadataComparator.schema_fingerprint
+"""
+import copy
+
+from pipeline.utils.metadata_comparator import MetadataComparator
+
+
+def _metadata():
+    # Column keys mirror what MetadataExtractor writes
+    return {
+        "columns": [
+            {"name": "ID", "data_type": "NUMBER", "is_nullable": False, "position": 1},
+            {"name": "NAME", "data_type": "VARCHAR", "is_nullable": True, "position": 2},
+        ],
+        "constraints": {"primary_key": ["ID"], "foreign_keys": []},
+        "comment": "",
+        "extracted_at": "2024-01-01T00:00:00",
+    }
+
+
+def test_fingerprint_ignores_volatile_fields():
+    old = _metadata()
+    new = copy.deepcopy(old)
+    new["extracted_at"] = "2024-02-01T00:00:00"
+
+    assert MetadataComparator.schema_fingerprint(old) == MetadataComparator.schema_fingerprint(new)
+
+
+def test_fingerprint_changes_on_nullability_change():
+    old = _metadata()
+    new = copy.deepcopy(old)
+    new["columns"][1]["is_nullable"] = False
+
+    assert MetadataComparator.schema_fingerprint(old) != MetadataComparator.schema_fingerprint(new)
+    assert MetadataComparator().compare_metadata(old, new)["has_changes"]
+
+
+def test_fingerprint_changes_on_position_change():
+    old = _metadata()
+    new = copy.deepcopy(old)
+    new["columns"][0]["position"], new["columns"][1]["position"] = 2, 1
+
+    assert MetadataComparator.schema_fingerprint(old) != MetadataComparator.schema_fingerprint(new)